@@ -0,0 +1,13 @@
+"""
+BCC website proposal generator (Job Angula Technology Consulting).
+"""
+
+from .build import build_proposal, build_bytes, build_sections, new_document, SECTIONS
+from .content import default_content
+from .render_docx import render_docx
+from .render_markdown import render_markdown
+
+__all__ = [
+    "build_proposal", "build_bytes", "build_sections", "new_document", "default_content", "SECTIONS",
+    "render_docx", "render_markdown",
+]
@@ -0,0 +1,159 @@
+"""
+Batch generation of tailored proposals from a CSV or JSON manifest.
+
+Each manifest entry names an output file and carries content overrides (any
+top-level key of ``default_content()``). Entries are fanned out over a process
+pool whose workers import python-docx and load the template once, and every
+document is written to a temporary file and renamed into place.
+
+JSON manifests are a list of objects. CSV manifests have one row per proposal;
+a column named ``cover.date`` sets a nested key, and cells starting with ``[``
+or ``{`` are decoded as JSON so list content such as ``prof_fees`` fits in a cell.
+An entry's ``content`` key (or the batch-wide ``content`` argument) names a
+content file that the entry's overrides are laid over; each worker parses a
+given file once.
+
+With ``archive`` the documents are not written to disk one by one: workers
+return the bytes and the parent streams each into a single zip archive (a
+path or any writable binary stream) as soon as it is ready.
+
+With ``cache_dir`` every document goes through a ``reproducible.OutputCache``:
+entries whose content has not changed since a previous run are copied from
+the cache instead of being built.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from .build import build_proposal
+from .content_file import load_content, merge_content
+from .package import atomic_write
+from .reproducible import OutputCache
+from .template import warm_worker
+
+
+def _parse_cell(value):
+    value = value.strip()
+    if value[:1] in ("[", "{"):
+        return json.loads(value)
+    return value
+
+def _row_to_entry(row):
+    """Turn a flat CSV row into a nested manifest entry."""
+    entry = {}
+    for column, value in row.items():
+        if not column or value is None or value.strip() == "":
+            continue
+        *parents, leaf = column.strip().split(".")
+        target = entry
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = _parse_cell(value)
+    return entry
+
+def load_manifest(path):
+    """Load manifest entries from a ``.json`` or ``.csv`` file."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            entries = [_row_to_entry(row) for row in csv.DictReader(f)]
+    else:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    for i, entry in enumerate(entries):
+        if not entry.get("output"):
+            raise ValueError(f"manifest entry {i} has no 'output'")
+    return entries
+
+def _build(data, out, cache_dir=None):
+    """Build ``data`` into the stream ``out``; return ``True`` if it came from the output cache."""
+    if cache_dir:
+        return OutputCache(cache_dir).build(data, out)
+    build_proposal(data, out)
+    return False
+
+def write_atomic(path, data, out_dir=None, cache_dir=None):
+    """Build ``data`` into ``path`` via a temporary file in the same directory.
+
+    Returns ``(path, cached)``.
+    """
+    if out_dir and not os.path.isabs(path):
+        path = os.path.join(out_dir, path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with atomic_write(path) as f:
+        cached = _build(data, f, cache_dir)
+    return path, cached
+
+def _run_entry(args):
+    """Build one entry; return ``(path, error, docx_bytes, cached)`` (bytes only when archiving)."""
+    entry, out_dir, content, archive, cache_dir = args
+    data = {k: v for k, v in entry.items() if k not in ("output", "content")}
+    content = entry.get("content", content)
+    try:
+        if content:
+            data = merge_content(load_content(content), data)
+        if archive:
+            buf = io.BytesIO()
+            cached = _build(data, buf, cache_dir)
+            return entry["output"], None, buf.getvalue(), cached
+        path, cached = write_atomic(entry["output"], data, out_dir, cache_dir)
+        return path, None, None, cached
+    except Exception as exc:
+        return entry["output"], f"{type(exc).__name__}: {exc}", None, False
+
+def _collect(results, archive):
+    """Drain ``results``, streaming documents into ``archive`` when one is given."""
+    if not archive:
+        return list(results)
+    collected = []
+    # Members are stored, not deflated: a .docx is already compressed
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        for path, error, payload, cached in results:
+            if error is None:
+                zf.writestr(path, payload)
+            collected.append((path, error, None, cached))
+    return collected
+
+def run_batch(entries, out_dir=None, jobs=None, content=None, archive=None, cache_dir=None):
+    """Generate every manifest entry and return a summary report dict.
+
+    ``archive`` (a path or writable binary stream) collects every document
+    in one zip archive, named by its ``output``, instead of separate files.
+    ``cache_dir`` reuses documents built by earlier runs for unchanged entries.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [(entry, out_dir, content, archive is not None, cache_dir) for entry in entries]
+    start = time.perf_counter()
+    if jobs == 1:
+        warm_worker()
+        results = _collect(map(_run_entry, tasks), archive)
+    else:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=warm_worker) as pool:
+            results = _collect(pool.map(_run_entry, tasks, chunksize=chunksize), archive)
+    elapsed = time.perf_counter() - start
+
+    written = [path for path, error, _, _ in results if error is None]
+    failed = [(path, error) for path, error, _, _ in results if error is not None]
+    return {
+        "documents": len(written),
+        "cached": sum(1 for _, error, _, cached in results if error is None and cached),
+        "failed": failed,
+        "jobs": jobs,
+        "seconds": elapsed,
+        "docs_per_second": len(written) / elapsed if elapsed else 0.0,
+    }
+
+def format_report(report):
+    lines = [
+        f"Generated {report['documents']} proposal(s) in {report['seconds']:.2f}s "
+        f"with {report['jobs']} worker(s) ({report['docs_per_second']:.1f} docs/s)"
+        + (f", {report['cached']} unchanged from cache" if report["cached"] else "")
+    ]
+    for path, error in report["failed"]:
+        lines.append(f"  FAILED {path}: {error}")
+    return "\n".join(lines)
@@ -0,0 +1,168 @@
+"""
+Scaling benchmarks for the document helpers and the full build.
+
+    python -m proposal.bench                  # run and compare with bench_baseline.json
+    python -m proposal.bench --save           # run and store the results as the baseline
+    python -m proposal.bench -k table -r 5    # only cases matching "table", best of 5
+
+Each case builds into a fresh document from the cached template. Wall time is
+the best of ``--repeat`` runs; peak memory comes from a separate run under
+``tracemalloc`` (so tracing does not skew the timing) and, for helper cases,
+covers only the helper calls; size is the saved ``.docx`` in bytes. A metric more than ``--threshold`` above its baseline is
+reported as a regression and makes the exit status non-zero.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .build import build_proposal, new_document
+from .gantt import add_gantt_chart
+from .helpers import add_styled_table, add_info_box, add_phase_block, add_icon_card_row
+
+DEFAULT_BASELINE = "bench_baseline.json"
+METRICS = ("seconds", "peak_bytes", "size_bytes")
+
+
+# ── Cases ──
+# name: (callable(doc) appending the content, or None for the full build)
+
+def _table(rows):
+    data = [[f"Item {i}", f"Description of line item {i}", f"{i * 100:,.2f}"] for i in range(rows)]
+    return lambda doc: add_styled_table(doc, ["No.", "Description", "Amount"], data, [3, 9, 4])
+
+def _info_boxes(count):
+    def run(doc):
+        for i in range(count):
+            add_info_box(doc, f"Box {i}", "Body text for the information box.\n\nSecond paragraph.")
+    return run
+
+def _phase_blocks(count):
+    items = ["Task one", "Task two", "Task three", "Task four"]
+    def run(doc):
+        for i in range(count):
+            add_phase_block(doc, str(i + 1), f"Phase {i + 1}", "Weeks 1\u20132", items)
+    return run
+
+def _card_rows(count):
+    cards = [("\u2605", "Card title", "Short card description")] * 3
+    def run(doc):
+        for _ in range(count):
+            add_icon_card_row(doc, cards)
+    return run
+
+def _gantt(columns):
+    step = max(1, columns // 6)
+    phases = [(f"Phase {i + 1}", 1 + i * step, min(columns, (i + 2) * step), "0073B7")
+              for i in range(6)]
+    phases.append(("Hosting", 1, columns, "FFF3CD"))
+    granularity = "day" if columns > 52 else "week"
+    return lambda doc: add_gantt_chart(doc, phases, granularity)
+
+CASES = {
+    **{f"table_{n}_rows": _table(n) for n in (10, 100, 1000, 10000)},
+    **{f"info_boxes_{n}": _info_boxes(n) for n in (1, 10, 100, 500)},
+    **{f"phase_blocks_{n}": _phase_blocks(n) for n in (1, 10, 100)},
+    **{f"card_rows_{n}": _card_rows(n) for n in (1, 10, 100)},
+    **{f"gantt_{n}_cols": _gantt(n) for n in (12, 52, 365)},
+    "full_proposal": None,
+}
+
+
+def _run_once(case):
+    """Build one case and return the saved document bytes."""
+    buf = io.BytesIO()
+    if case is None:
+        build_proposal(out=buf)
+    else:
+        doc = new_document()
+        case(doc)
+        doc.save(buf)
+    return buf.getvalue()
+
+def _traced_peak(case):
+    """Peak traced allocation; for helper cases only while the case itself runs."""
+    tracemalloc.start()
+    try:
+        if case is None:
+            build_proposal(out=io.BytesIO())
+        else:
+            doc = new_document()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            case(doc)
+            return tracemalloc.get_traced_memory()[1] - base
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def measure(case, repeat=3):
+    """Return ``{seconds, peak_bytes, size_bytes}`` for one case."""
+    _run_once(case)  # warm the template cache and imports
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = _run_once(case)
+        best = min(best, time.perf_counter() - t0)
+    return {"seconds": best, "peak_bytes": _traced_peak(case), "size_bytes": len(data)}
+
+def compare(results, baseline, threshold):
+    """Return ``(case, metric, baseline, current, ratio)`` for every regression."""
+    regressions = []
+    for name, metrics in results.items():
+        for metric in METRICS:
+            base = baseline.get(name, {}).get(metric)
+            if base and metrics[metric] > base * (1 + threshold):
+                regressions.append((name, metric, base, metrics[metric], metrics[metric] / base))
+    return regressions
+
+def format_results(results, baseline):
+    lines = [f"{'case':<22}{'ms':>10}{'peak KiB':>11}{'size KiB':>10}{'vs base':>9}"]
+    for name, m in results.items():
+        base = baseline.get(name, {}).get("seconds")
+        delta = f"{m['seconds'] / base:>8.2f}x" if base else f"{'-':>9}"
+        lines.append(f"{name:<22}{m['seconds'] * 1000:>10.1f}{m['peak_bytes'] / 1024:>11.0f}"
+                     f"{m['size_bytes'] / 1024:>10.1f}{delta}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Proposal generation benchmarks")
+    parser.add_argument("-k", "--filter", help="only run cases whose name contains this")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="flag metrics more than this fraction above baseline (default 0.2)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, case in CASES.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(case, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+    print(format_results(results, baseline))
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(baseline, fh, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, base, current, ratio in regressions:
+        print(f"REGRESSION {name} {metric}: {base:,.4g} -> {current:,.4g} ({ratio:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,679 @@
+"""
+Section builders and the side-effect-free ``build_proposal()`` entry point.
+
+Every section builder takes the content mapping from ``proposal.content`` and
+returns an ``ir.Section``; the DOCX and Markdown renderers then walk the same
+document model. Nothing touches module state, so one warm process can build
+any number of proposals back to back.
+"""
+
+import io
+from decimal import Decimal
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from .content import default_content
+from .helpers import ACCENT_BAR, SECTION_BG
+from .ir import (
+    Section, Heading, Body, Para, Spacer, Bullet, InfoBox, Box, Grid, CardRow,
+    PhaseBlock, Table, BarChart, Gantt, Image, styled_table,
+)
+from .render_docx import render_section
+from .render_markdown import render_markdown
+from .template import new_document
+
+
+# ── Amounts ──
+
+def parse_amount(text):
+    """Parse a "12,345.00" amount cell; blank cells count as zero."""
+    return Decimal(text.replace(",", "")) if text else Decimal(0)
+
+def format_amount(value):
+    """Format an amount the way the fee tables print it ("12,345.00")."""
+    return f"{value:,.2f}"
+
+def fee_totals(data):
+    """Compute the financial summary figures from the fee and cost line items."""
+    prof = sum((parse_amount(amt) for no, desc, amt in data["prof_fees"] if no), Decimal(0))
+    groups = {prefix: Decimal(0) for prefix in data["cost_groups"]}
+    other = Decimal(0)
+    for no, desc, amt in data["other_costs"]:
+        amount = parse_amount(amt)
+        other += amount
+        prefix = no.split(".")[0]
+        if prefix in groups:
+            groups[prefix] += amount
+    total = prof + other
+    vat = total * Decimal(data["vat_rate"]) / 100
+    return {
+        "prof_fees": prof,
+        "other_costs": other,
+        "groups": groups,
+        "total": total,
+        "vat": vat,
+        "grand_total": total + vat,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                        COVER PAGE
+# ═══════════════════════════════════════════════════════════════════
+
+def _frame(color, sz="2", left=None):
+    """Cell borders on all four edges, optionally with a heavier left edge."""
+    edge = {"val": "single", "sz": sz, "color": color}
+    return {"top": edge, "bottom": edge,
+            "left": dict(edge, sz=left) if left else edge, "right": edge}
+
+def _left_rule(color, sz):
+    return {"left": {"val": "single", "sz": sz, "color": color}}
+
+def cover_section(data):
+    cover = data["cover"]
+    parties = [("Submitted by:", cover["submitted_by"]), ("Submitted to:", cover["submitted_to"])]
+
+    return Section("Cover", [
+        # Top colour bar
+        Para(border=("top", 48)),
+        Spacer(2),
+        Para([(cover["title"], "CoverTitle")], align="center"),
+        Para([(cover["subtitle"], "CoverSubtitle")], align="center"),
+        # Decorative line
+        Para(align="center", border=("bottom", 24)),
+        Spacer(),
+        # Submitted by / to box
+        Grid([Box([Para([(label, "LabelText")], align="left"),
+                   Para([(name, "PartyName")]),
+                   Para([(address, "SmallText")])])
+              for label, (name, address) in parties], cols=2),
+        Spacer(),
+        Para([(cover["date"], "CoverDate")], align="center"),
+        # Bottom colour bar
+        Para(border=("bottom", 48)),
+    ])
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    TABLE OF CONTENTS
+# ═══════════════════════════════════════════════════════════════════
+
+def toc_section(data):
+    return Section("TOC", [
+        Heading("Table of Contents"),
+        Spacer(),
+        Table(data["toc_items"], banded=True,
+              row_styles=(("TocSection", None, "TocPage"), None),
+              col_align=(None, None, "right")),
+    ])
+
+def toc_pages(items, pages):
+    """``toc_items`` with the page of each row naming a section taken from ``pages`` (bookmark -> page)."""
+    return [(name, title, str(pages.get(section_bookmark(name), page))) for name, title, page in items]
+
+def fill_toc(doc, items):
+    """Write the page column of ``items`` into the rendered TOC table."""
+    body = doc.element.body
+    mark = next((el for el in body.iterchildren(qn("w:bookmarkStart"))
+                 if el.get(qn("w:name")) == section_bookmark("TOC")), None)
+    table = next(mark.itersiblings(qn("w:tbl")), None) if mark is not None else None
+    if table is None:
+        return
+    for tr, (_, _, page) in zip(table.iterchildren(qn("w:tr")), items):
+        texts = list(tr[-1].iter(qn("w:t")))
+        if texts:
+            texts[-1].text = page
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION A: COVER LETTER
+# ═══════════════════════════════════════════════════════════════════
+
+def cover_letter_section(data):
+    letter = data["letter"]
+
+    return Section("Section A", [
+        Heading("Section A: Cover Letter"),
+        Spacer(),
+        Body(letter["date"]),
+        Spacer(),
+        Body(letter["recipient"]),
+        Spacer(),
+        Para([(letter["subject"], "StrongText")]),
+        Spacer(),
+        Body("Dear Sir/Madam,"),
+        Spacer(),
+        Body("I, Job Angula, the Principal Consultant and sole proprietor of Job Angula Technology Consulting, hereby submit this Expression of Interest in response to the call for the design, development, implementation, and hosting of the Benguela Current Convention (BCC) website."),
+        Body("Job Angula Technology Consulting is a Namibian-based technology consulting firm specialising in custom web application development, website design, content management systems, and digital solutions for organisations across Southern Africa. We have a demonstrated track record of delivering modern, responsive, and user-friendly web platforms for both private and public sector clients."),
+        Body("We understand that the BCC requires a website that is interactive, modern, and reflective of its identity as the world\u2019s first intergovernmental Convention based on a multi-sectoral approach to Large Marine Ecosystem ocean governance. We are confident that our expertise in building custom, tailor-made content management systems and modern web applications positions us uniquely to deliver a solution that meets and exceeds the BCC\u2019s expectations."),
+        Body("Our approach centres on building a bespoke Content Management System specifically engineered for BCC\u2019s operational needs \u2013 enabling your Secretariat staff to independently manage bilingual content (English and Portuguese), upload documents, manage media, and maintain the website without requiring technical expertise. This custom approach eliminates the security vulnerabilities and bloat associated with off-the-shelf CMS platforms while providing exactly the features BCC needs."),
+        Body("We are committed to delivering a high-quality, secure, and fully functional website within the stipulated timelines, and to providing reliable hosting and maintenance services for the three-year contract period."),
+        Body("We look forward to the opportunity to contribute to the BCC\u2019s digital transformation and enhanced stakeholder engagement."),
+        Spacer(),
+        Body("Yours faithfully,"),
+        Spacer(2),
+        Para([("___________________________", "SignatureLine")]),
+        Para([("Job Angula", "TitleText")]),
+        Body("Principal Consultant\nJob Angula Technology Consulting\nWindhoek, Namibia\nPhone: +264 XX XXX XXXX\nEmail: job@angulaconsulting.com"),
+    ])
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION B: COMPANY PROFILE
+# ═══════════════════════════════════════════════════════════════════
+
+def company_profile_section(data):
+    children = [
+        Heading("Section B: Company Profile"),
+        Spacer(),
+        Heading("1. About the Firm", level=2),
+        Body("Job Angula Technology Consulting is a Namibia-registered technology consulting firm founded and led by Job Angula, a seasoned full-stack software developer and technology consultant. The firm specialises in custom web development, application design, and digital solutions for organisations seeking purpose-built technology platforms."),
+        Body("Operating from Windhoek, Namibia, the firm serves clients across the Southern African region, with particular expertise in developing solutions for organisations that require robust, secure, and user-friendly digital platforms."),
+        Spacer(),
+        # Core Competencies - Visual cards
+        Heading("2. Core Competencies", level=2),
+        Spacer(),
+    ]
+    for cards in data["competencies"]:
+        children += [CardRow(cards), Spacer()]
+
+    children += [
+        Heading("3. Principal Consultant", level=2),
+        Spacer(),
+        InfoBox(
+            "Job Angula \u2013 Principal Consultant & Lead Developer",
+            "Full-stack web developer and technology consultant with extensive experience in designing and "
+            "developing web-based solutions for diverse clients. Technical proficiency spans front-end design, "
+            "back-end development, database architecture, server administration, and cloud hosting.\n\n"
+            "Key Skills: HTML5, CSS3, JavaScript, React/Next.js, Python, Node.js, PostgreSQL, REST APIs, "
+            "AWS, DigitalOcean, Web Security, WCAG 2.1 Accessibility\n\n"
+            "[ATTACH FULL CV AS ANNEXURE]",
+            SECTION_BG,
+        ),
+        Spacer(),
+        Heading("4. Specialist Subcontractors", level=2),
+        Body("For specialised deliverables, Job Angula Technology Consulting engages trusted subcontractors:"),
+        Spacer(),
+        styled_table(["Role", "Responsibility"], data["subcontractors"], [5, 11]),
+        Spacer(),
+        Heading("5. Business Details", level=2),
+        Spacer(),
+        styled_table(["Detail", "Information"], data["business_details"], [5, 11]),
+    ]
+    return Section("Section B", children)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION C: TECHNICAL PROPOSAL
+# ═══════════════════════════════════════════════════════════════════
+
+def technical_proposal_section(data):
+    children = [
+        Heading("Section C: Technical Proposal"),
+        Spacer(),
+
+        # ── Understanding of TOR ──
+        Heading("1. Understanding of the Terms of Reference", level=2),
+        Body("The Benguela Current Convention (BCC) is a pioneering intergovernmental organisation established by Angola, Namibia, and South Africa to promote integrated management and sustainable development of the Benguela Current Large Marine Ecosystem. As the first convention in the world based on a multi-sectoral approach to Large Marine Ecosystem ocean governance, BCC occupies a unique and prestigious position in the global marine conservation landscape."),
+        Body("The BCC Secretariat communicates with a diverse stakeholder base \u2013 including policy makers, administrators, technocrats, academics, students, the private sector, and the general public \u2013 in both English and Portuguese. A modern, professional website is central to this communication mandate."),
+        Spacer(),
+
+        # Key Requirements Visual
+        Heading("Core Requirements Identified:", level=3),
+        Spacer(),
+        Grid([Box([Para([(title, "TableStrong")]), Para([(desc, "NoteText")])],
+                  SECTION_BG, _frame("CCCCCC"))
+              for title, desc in data["requirements"]], cols=2),
+        Spacer(),
+
+        # ── Why Custom CMS ──
+        Heading("2. Proposed Technical Approach", level=2),
+        Spacer(),
+        Heading("2.1 Why a Custom CMS?", level=3),
+        Body("Rather than relying on off-the-shelf platforms such as WordPress or Drupal, we propose building a bespoke Content Management System specifically engineered for BCC\u2019s needs. This approach offers significant advantages:"),
+        Spacer(),
+        styled_table(["Factor", "Custom CMS (Our Approach)", "Off-the-shelf (WordPress)"],
+                     data["cms_comparison"], [3, 6.5, 6.5]),
+        Spacer(),
+
+        # ── Technology Stack ──
+        Heading("2.2 Technology Stack", level=3),
+        Spacer(),
+        styled_table(["Component", "Technology", "Rationale"], data["tech_stack"], [3, 5, 8]),
+        Spacer(),
+
+        # ── Three Design Concepts ──
+        Heading("2.3 Three Design Concepts", level=3),
+        Body("As required, we will deliver three distinct design concepts for BCC\u2019s consideration:"),
+        Spacer(),
+    ]
+
+    # Concept cards, titled in each concept's own accent colour
+    concept_styles = {}
+    for title, color, desc in data["concepts"]:
+        title_style = f"ConceptTitle{color}"
+        concept_styles[title_style] = (12, color, True)
+        children += [
+            Box([Para([(title, title_style)]), Para([(desc, "SmallText")])],
+                "FFFFFF", _frame(color, left="18")),
+            Spacer(),
+        ]
+
+    children += [
+        Body("All three concepts will be fully responsive (desktop, tablet, mobile), compliant with WCAG 2.1 accessibility standards, and reflective of BCC\u2019s corporate identity."),
+        Spacer(),
+
+        # ── Key Features ──
+        Heading("2.4 Key Features & Functionality", level=3),
+        Spacer(),
+    ]
+    for icon, name, badge, desc in data["features"]:
+        children.append(Box(
+            [Para([(icon + "  ", "FeatureIcon"), (name, "StrongText"), (f"  [{badge}]", "BadgeText")]),
+             Para([(desc, "SmallText")])],
+            SECTION_BG, _left_rule(ACCENT_BAR, "12"),
+        ))
+
+    migration_steps = data["migration_steps"]
+    children += [
+        Spacer(),
+
+        # ── Content Migration ──
+        Heading("2.5 Content Migration Strategy", level=3),
+        Spacer(),
+        Grid([Box([Para([(num, "StepNumber")], align="center"),
+                   Para([(label, "StepLabel")], align="center")],
+                  color, _frame(color))
+              for (num, label, _), color in zip(migration_steps, data["migration_colors"])],
+             cols=len(migration_steps)),
+        Spacer(),
+    ]
+    # Descriptions below
+    children += [Bullet(f" {desc}", f"Step {num} \u2013 {label}:") for num, label, desc in migration_steps]
+
+    children += [
+        Spacer(),
+
+        # ── Security ──
+        Heading("2.6 Security Measures", level=3),
+        Spacer(),
+        *(Bullet(item, "\u2713 ") for item in data["security_items"]),
+        Spacer(),
+
+        # ── Hosting Architecture ──
+        Heading("2.7 Hosting Architecture", level=3),
+        Body("The BCC website and BCLME RIIMS will be hosted on a high-availability cloud infrastructure:"),
+        Spacer(),
+        styled_table(["Component", "Specification"], data["hosting"], [5, 11]),
+        Spacer(),
+
+        # ── Training ──
+        Heading("2.8 Training & Handover", level=3),
+        Spacer(),
+        styled_table(["Training Component", "Description", "Duration"], data["training"], [4, 9, 3]),
+        Spacer(),
+        Body("Deliverables: Comprehensive User Manual (printed & digital PDF), video tutorials for key CMS functions, quick-reference guide, and ongoing email/phone support during the 3-year hosting period."),
+    ]
+    return Section("Section C", children, styles=concept_styles)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                 SECTION C (cont): METHODOLOGY
+# ═══════════════════════════════════════════════════════════════════
+
+def methodology_section(data):
+    children = [
+        Heading("3. Implementation Methodology", level=2),
+        Body("Our implementation follows an Agile-inspired methodology with structured phases and regular client feedback:"),
+        Spacer(),
+    ]
+    for (num, title, duration, items), color in zip(data["phases"], data["phase_colors"]):
+        children += [PhaseBlock(num, title, duration, items, color), Spacer()]
+    return Section("Methodology", children)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION D: WORK PLAN
+# ═══════════════════════════════════════════════════════════════════
+
+def work_plan_section(data):
+    return Section("Section D", [
+        Heading("Section D: Work Plan"),
+        Spacer(),
+        Body("The following detailed work plan outlines tasks and deliverables across the 12-week development phase and the subsequent 3-year hosting period."),
+        Spacer(),
+        styled_table(["Timeline", "Activity", "Deliverable"], data["workplan"], [3, 8.5, 4.5]),
+        Spacer(),
+
+        # Visual Gantt-like chart
+        Heading("Visual Project Timeline", level=2),
+        Spacer(),
+        Gantt(data["gantt_phases"], **data["gantt"]),
+        Spacer(),
+        Body("Reporting: Bi-weekly progress reports submitted to the Manager: Marketing & Communication and Manager: Data and Information Management, with oversight from the Executive Secretary."),
+    ])
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION E: FINANCIAL PROPOSAL
+# ═══════════════════════════════════════════════════════════════════
+
+def _fee_row_format(row):
+    """Row styling for professional-fee lines (group headings, subtotals, items)."""
+    no, desc, amt = row
+    if desc.startswith("Subtotal"):
+        return "TableStrong", "D6EAF8"
+    if no == "":
+        return "TableStrong", "E8F0FE"
+    return "SmallText", None
+
+def financial_proposal_section(data):
+    totals = fee_totals(data)
+    prof_fees = data["prof_fees"]
+
+    # Budget breakdown: professional fees plus one bar per other-cost group
+    breakdown = [("Professional Fees", "Professional Fees", totals["prof_fees"], ACCENT_BAR)]
+    for prefix, (label, bar_label, color) in data["cost_groups"].items():
+        breakdown.append((label, bar_label, totals["groups"][prefix], color))
+    grand = totals["total"] or Decimal(1)
+    breakdown = [(label, bar_label, amount, round(amount * 100 / grand), color)
+                 for label, bar_label, amount, color in breakdown]
+
+    summary_data = [
+        ("Professional Fees", format_amount(totals["prof_fees"])),
+        ("Other Costs (Hosting, Maintenance, Travel)", format_amount(totals["other_costs"])),
+        ("TOTAL (VAT Exclusive)", format_amount(totals["total"])),
+        (f"VAT ({data['vat_rate']}%)", format_amount(totals["vat"])),
+        ("GRAND TOTAL (VAT Inclusive)", format_amount(totals["grand_total"])),
+    ]
+    summary_styles = [(None, None)] * 2 + [("StrongText", "D6EAF8")] * 2 + [("GrandTotalText", None)]
+
+    return Section("Section E", [
+        Heading("Section E: Financial Proposal"),
+        Spacer(),
+        Body("The financial proposal separates professional fees from other costs related to the assignment, as stipulated in the Terms of Reference. All amounts are in Namibian Dollars (NAD)."),
+        Spacer(),
+
+        # Professional Fees
+        Heading("1. Professional Fees", level=2),
+        Spacer(),
+        Table(
+            list(prof_fees) + [["", "TOTAL PROFESSIONAL FEES", format_amount(totals["prof_fees"])]],
+            ["No.", "Description", "Amount (NAD)"],
+            banded=True,
+            total_row=True,
+            row_styles=[_fee_row_format(row) for row in prof_fees] + [("TotalText", None)],
+            col_align=(None, None, "right"),
+        ),
+        Spacer(),
+
+        # Other Costs
+        Heading("2. Other Costs", level=2),
+        Spacer(),
+        styled_table(["No.", "Description", "Amount (NAD)"], data["other_costs"], [2, 10, 4]),
+
+        # Other costs total
+        Spacer(),
+        Table(
+            [["", "TOTAL OTHER COSTS", format_amount(totals["other_costs"])]],
+            total_row=True,
+            row_styles=("TotalText", None),
+            col_align=(None, None, "right"),
+        ),
+        Spacer(2),
+
+        # Grand Summary
+        Heading("3. Summary", level=2),
+        Spacer(),
+        InfoBox(
+            "Budget Allocation Overview",
+            " \u2502 ".join(f"{label}: NAD {amount:,.0f} ({pct}%)" for label, _, amount, pct, _ in breakdown),
+            SECTION_BG,
+        ),
+        Spacer(),
+
+        # Visual budget bars
+        BarChart([(bar_label, pct, color) for _, bar_label, _, pct, color in breakdown]),
+        Spacer(),
+        Table(
+            [(label, "NAD " + amount) for label, amount in summary_data],
+            banded=True,
+            total_row=True,
+            row_styles=summary_styles,
+            col_align=(None, "right"),
+        ),
+        Spacer(),
+        InfoBox(
+            "Note",
+            "If Job Angula Technology Consulting is not VAT-registered, please remove the VAT line. "
+            f"The Grand Total would then be NAD {format_amount(totals['total'])}. Adjust accordingly before submission.",
+            "FFF8E1",
+        ),
+    ])
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    SECTION F: REFERENCES
+# ═══════════════════════════════════════════════════════════════════
+
+# Printed widths (inches) of portfolio screenshots
+SCREENSHOT_WIDTH = 6.0
+REFERENCE_SHOT_WIDTH = 4.5
+
+def _screenshots(rows, width, dpi):
+    nodes = []
+    for caption, path in rows:
+        nodes += [Spacer(), Image(path, width, caption, dpi)]
+    return nodes
+
+def references_section(data):
+    children = [Heading("Section F: References"), Spacer()]
+
+    for i, ref in enumerate(data["references"]):
+        if i:
+            children.append(Spacer())
+        children.append(Box(
+            [Para([(ref["title"], "TitleText")])]
+            + [Para([(label + " ", "AccentLabel"), (value, "SmallText")])
+               for label, value in ref["details"]],
+            SECTION_BG, _left_rule(ref["color"], "18"),
+        ))
+        children += _screenshots(ref.get("screenshots", ()), REFERENCE_SHOT_WIDTH, data["image_dpi"])
+
+    return Section("Section F", children)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    ANNEXURES CHECKLIST
+# ═══════════════════════════════════════════════════════════════════
+
+def annexures_section(data):
+    children = [
+        Heading("Annexures: Supporting Documents"),
+        Spacer(),
+        Body("The following supporting documents are to be attached to this proposal:"),
+        Spacer(),
+        Table(data["annexures"], banded=True,
+              row_styles=(("AccentLabel", "SmallText", "CheckBox"), None),
+              col_align=(None, None, "center")),
+        Spacer(2),
+    ]
+
+    # Portfolio screenshots (Annexure 5)
+    if data["screenshots"]:
+        children.append(Heading("Portfolio Screenshots", level=2))
+        children += _screenshots(data["screenshots"], SCREENSHOT_WIDTH, data["image_dpi"])
+        children.append(Spacer(2))
+
+    # Final footer
+    children.append(Para([(data["footer"], "FooterNote")], align="center", border=("top", 12, "8")))
+    return Section("Annexures", children, page_break=False)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#                    BUILD
+# ═══════════════════════════════════════════════════════════════════
+
+SECTIONS = (
+    ("Cover", cover_section),
+    ("TOC", toc_section),
+    ("Section A", cover_letter_section),
+    ("Section B", company_profile_section),
+    ("Section C", technical_proposal_section),
+    ("Methodology", methodology_section),
+    ("Section D", work_plan_section),
+    ("Section E", financial_proposal_section),
+    ("Section F", references_section),
+    ("Annexures", annexures_section),
+)
+
+def section_bookmark(name):
+    """Hidden bookmark name marking a section's extent ("Section E" -> "_Proposal_Section_E")."""
+    return "_Proposal_" + name.replace(" ", "_")
+
+def _mark(doc, tag, index, name=None):
+    """Insert a body-level ``w:bookmarkStart``/``w:bookmarkEnd`` before the trailing sectPr."""
+    mark = OxmlElement(tag)
+    mark.set(qn("w:id"), str(index))
+    if name:
+        mark.set(qn("w:name"), name)
+    doc.element.body[-1].addprevious(mark)
+
+def resolve_content(data=None):
+    """Overlay caller-supplied keys on a fresh copy of the default content.
+
+    Mapping values (``cover``, ``letter`` ...) are merged key by key, so an
+    override may change just the cover date; any other value replaces the default.
+    """
+    content = default_content()
+    for key, value in (data or {}).items():
+        if isinstance(value, dict) and isinstance(content.get(key), dict):
+            content[key].update(value)
+        else:
+            content[key] = value
+    return content
+
+def build_sections(data=None):
+    """Build the document model (a list of ``ir.Section``) for ``data``."""
+    data = resolve_content(data)
+    return [section(data) for _, section in SECTIONS]
+
+def layout_document(doc, data):
+    """Fix the table widths of ``doc`` and write the estimated page numbers into its TOC.
+
+    Returns the TOC items with those page numbers.
+    """
+    from .layout import estimate_layout
+    items = toc_pages(data["toc_items"], estimate_layout(doc)["pages"])
+    fill_toc(doc, items)
+    return items
+
+def _layout(doc, data, sections, cache=None):
+    """``layout_document``, replayed from ``cache`` when it has seen these sections; updates the TOC node."""
+    from .layout import apply_table_widths, table_widths
+    record = cache.load_layout(sections) if cache is not None else None
+    if record is None:
+        items = layout_document(doc, data)
+        if cache is not None:
+            cache.store_layout(sections, {"toc_items": items, "widths": table_widths(doc)})
+    else:
+        items = [tuple(item) for item in record["toc_items"]]
+        apply_table_widths(doc, record["widths"])
+        fill_toc(doc, items)
+    index = [name for name, _ in SECTIONS].index("TOC")
+    sections[index] = toc_section(dict(data, toc_items=items))
+
+def build_proposal(data=None, out=None, markdown=None, profiler=None, cache=None, jobs=None,
+                   deterministic=False, optimize=False, layout=True):
+    """Build the proposal document.
+
+    ``data`` overrides any top-level key of ``default_content()``; ``out`` is a
+    path or any writable binary stream, seekable or not (stdout, a pipe, a
+    socket's ``makefile("wb")``): each zip member is written as soon as it is
+    compressed. ``markdown``, if given, is a path or
+    writable text stream that receives the Markdown rendering of the same
+    document model. A ``proposal.profile.Profiler`` passed as ``profiler``
+    measures each section, node and the save. With a
+    ``proposal.incremental.SectionCache`` as ``cache``, sections whose content
+    is unchanged are spliced in from the cache instead of being re-rendered.
+    Otherwise ``jobs`` > 1 renders the sections in that many worker processes
+    (see ``proposal.parallel``). ``deterministic`` pins zip timestamps and
+    document dates so equal content saves to equal bytes (see
+    ``proposal.reproducible``). ``layout`` estimates the pagination (see
+    ``proposal.layout``) to fill in the TOC page numbers and fix table column
+    widths, replaying the estimate stored in ``cache`` when every section is
+    unchanged; ``optimize`` runs ``proposal.optimize`` over the document before
+    it is saved.
+    Each section is bracketed by a hidden ``section_bookmark`` so
+    ``proposal.patch`` can later replace it in the saved file. The built
+    ``Document`` is returned either way.
+    """
+    data = resolve_content(data)
+    doc = new_document()
+    render = render_section if cache is None else cache.render
+    built, parallel = None, None
+    if data["screenshots"] or any(ref.get("screenshots") for ref in data["references"]):
+        # Downscale every screenshot up front, in parallel, before rendering
+        from .images import image_nodes, prepare_images
+        built = [build_section(data) for _, build_section in SECTIONS]
+        prepare_images(image_nodes(built), cache.directory if cache else None, jobs)
+    if cache is None and jobs not in (None, 1):
+        from .parallel import ParallelRenderer
+        built = built or [build_section(data) for _, build_section in SECTIONS]
+        parallel = ParallelRenderer(built, jobs)
+        render = parallel.render
+    sections = []
+    try:
+        for index, (name, build_section) in enumerate(SECTIONS):
+            # Each section sits between hidden bookmarks so ``proposal.patch`` can find it
+            _mark(doc, "w:bookmarkStart", index, section_bookmark(name))
+            if profiler is None:
+                section = built[index] if built else build_section(data)
+                render(doc, section)
+            else:
+                with profiler.section(name, doc):
+                    section = built[index] if built else build_section(data)
+                    render(doc, section, profiler)
+            _mark(doc, "w:bookmarkEnd", index)
+            sections.append(section)
+    finally:
+        if parallel is not None:
+            parallel.close()
+    if layout:
+        if profiler is None:
+            _layout(doc, data, sections, cache)
+        else:
+            with profiler.section("Layout", doc):
+                _layout(doc, data, sections, cache)
+    if optimize:
+        from .optimize import optimize_document
+        if profiler is None:
+            optimize_document(doc)
+        else:
+            with profiler.section("Optimise", doc):
+                optimize_document(doc)
+    save = doc.save
+    if deterministic:
+        from .reproducible import save_deterministic
+        save = lambda out: save_deterministic(doc, out)
+    if out is not None:
+        if profiler is None:
+            save(out)
+        else:
+            with profiler.section("Save", doc):
+                save(out)
+    if markdown is not None:
+        text = render_markdown(sections)
+        if hasattr(markdown, "write"):
+            markdown.write(text)
+        else:
+            with open(markdown, "w", encoding="utf-8") as fh:
+                fh.write(text)
+    return doc
+
+def build_bytes(data=None, **options):
+    """Build the proposal in memory and return the .docx bytes (``build_proposal`` options apply)."""
+    buf = io.BytesIO()
+    build_proposal(data, out=buf, **options)
+    return buf.getvalue()
@@ -0,0 +1,408 @@
+"""
+Default content for the BCC website proposal.
+
+The section renderers in ``proposal.build`` read everything client-specific from
+the content mapping returned by ``default_content()``, so a caller can override
+any key (cover page, fees, references, annexures ...) without touching layout.
+"""
+
+import copy
+
+# ── Cover Page ──
+COVER = {
+    "title": "EXPRESSION OF INTEREST",
+    "subtitle": "Revamping and Re-Designing of the\nBenguela Current Convention (BCC) Website",
+    "submitted_by": ("Job Angula Technology Consulting",
+                     "Windhoek, Namibia\njob@angulaconsulting.com\nwww.angulaconsulting.com"),
+    "submitted_to": ("Benguela Current Convention (BCC)",
+                     "Secretariat\nNo. 1 Strand Street\nP/Bag 5031 Swakopmund, Namibia"),
+    "date": "February 2026",
+}
+
+# ── Table of Contents ──
+TOC_ITEMS = [
+    ("Section A", "Cover Letter", "3"),
+    ("Section B", "Company Profile", "4"),
+    ("Section C", "Technical Proposal", "6"),
+    ("Section D", "Work Plan", "14"),
+    ("Section E", "Financial Proposal", "16"),
+    ("Section F", "References", "18"),
+    ("Annexures", "Supporting Documents", "19"),
+]
+
+# ── Section A: Cover Letter ──
+LETTER = {
+    "date": "[DD] February 2026",
+    "recipient": "The Executive Secretary\nBenguela Current Convention (BCC) Secretariat\n"
+                 "No. 1 Strand Street\nP/Bag 5031\nSwakopmund, Namibia",
+    "subject": "Re: Expression of Interest \u2013 Revamping and Re-Designing of the BCC Website",
+}
+
+# ── Section B: Company Profile ──
+COMPETENCIES = [
+    [
+        ("\U0001F310", "Web Development", "Custom websites &\nweb applications"),
+        ("\U0001F3A8", "UI/UX Design", "User-centred design\nfor intuitive interfaces"),
+        ("\U0001F4BB", "Custom CMS", "Purpose-built content\nmanagement systems"),
+    ],
+    [
+        ("\u2601\ufe0f", "Cloud Hosting", "Reliable infrastructure\n& server management"),
+        ("\U0001F512", "Security", "Data protection &\ncyber security"),
+        ("\U0001F30D", "Multilingual", "Bilingual/multilingual\nweb solutions"),
+    ],
+]
+
+SUBCONTRACTORS = [
+    ["UI/UX Designer", "Visual design concepts, wireframes, and prototyping"],
+    ["Content Strategist", "Content architecture, migration planning, and information design"],
+    ["QA/Testing Specialist", "Cross-browser testing, performance testing, and quality assurance"],
+    ["Portuguese Language QA", "Linguistic quality assurance for the Portuguese interface"],
+]
+
+BUSINESS_DETAILS = [
+    ["Business Name", "Job Angula Technology Consulting"],
+    ["Principal", "Job Angula"],
+    ["Location", "Windhoek, Namibia"],
+    ["Phone", "+264 XX XXX XXXX"],
+    ["Email", "job@angulaconsulting.com"],
+    ["Website", "www.angulaconsulting.com"],
+    ["Registration", "[INSERT BUSINESS REGISTRATION NUMBER]"],
+]
+
+# ── Section C: Technical Proposal ──
+REQUIREMENTS = [
+    ("\U0001F310 Website Revamp", "Modern, interactive redesign reflecting BCC\u2019s identity"),
+    ("\U0001F4AC Bilingual Platform", "Full English & Portuguese support with seamless switching"),
+    ("\u2699\ufe0f Custom CMS", "Intuitive system for Secretariat staff to manage content independently"),
+    ("\U0001F4C1 Document Repository", "Secure, searchable repository for reports and policy documents"),
+    ("\U0001F91D Stakeholder Engagement", "Social media integration, newsletter, and interactive features"),
+    ("\u2601\ufe0f Hosting & Maintenance", "Reliable 3-year hosting for BCC website and BCLME RIIMS"),
+    ("\U0001F393 Training & Handover", "Comprehensive staff training with user manuals"),
+    ("\U0001F512 Compliance", "Data protection and WCAG 2.1 accessibility standards"),
+]
+
+CMS_COMPARISON = [
+    ["Security", "Minimal attack surface; no known public exploits", "Frequent target of automated attacks; thousands of known vulnerabilities"],
+    ["Performance", "Lean codebase; only features BCC needs", "Bloated with unused features and plugins"],
+    ["Tailored UX", "Admin interface designed for BCC staff workflows", "Generic admin panels requiring adaptation"],
+    ["Maintenance", "No dependency on third-party plugin updates", "Constant plugin and core updates required"],
+    ["Ownership", "BCC owns 100% of the code", "Dependent on open-source community"],
+    ["Bilingual", "Native dual-language architecture from ground up", "Relies on third-party translation plugins"],
+]
+
+TECH_STACK = [
+    ["Front-end", "HTML5, CSS3, React / Next.js", "Modern, fast, responsive UI with excellent SEO"],
+    ["Back-end", "Node.js / Python (Django)", "Robust, scalable server-side framework"],
+    ["Database", "PostgreSQL", "Enterprise-grade; excellent for multilingual content"],
+    ["CMS Admin", "Custom-built dashboard", "Intuitive interface tailored to BCC workflows"],
+    ["Hosting", "Cloud VPS (AWS / DigitalOcean)", "High availability; data centres near Southern Africa"],
+    ["CDN", "Cloudflare", "Global content delivery for fast page loads"],
+    ["Security", "SSL + WAF + CSP Headers", "HTTPS encryption and web application firewall"],
+    ["Analytics", "Built-in + Google Analytics", "Hit counter and detailed traffic analytics"],
+]
+
+CONCEPTS = [
+    ("Concept 1: \u201cOcean Authority\u201d",
+     "0073B7",
+     "A bold, authoritative design with deep ocean blues and clean lines. Emphasises BCC\u2019s role as a "
+     "serious intergovernmental body. Features large hero imagery of the Benguela Current ecosystem, "
+     "structured navigation, and a formal yet accessible layout."),
+    ("Concept 2: \u201cLiving Ecosystem\u201d",
+     "009B72",
+     "A vibrant, dynamic design inspired by the marine biodiversity of the BCLME. Uses rich photography, "
+     "animated ocean elements, and a colour palette drawn from the sea. Interactive maps and visual "
+     "storytelling are central features."),
+    ("Concept 3: \u201cConnected Shores\u201d",
+     "D4A017",
+     "A warm, collaborative design emphasising the partnership between Angola, Namibia, and South Africa. "
+     "Features the three nations\u2019 colours as accent tones within BCC\u2019s brand palette. Clean, minimal "
+     "layout with emphasis on readability and accessibility."),
+]
+
+FEATURES = [
+    ("\U0001F4AC", "Bilingual Architecture", "EN/PT",
+     "Language toggle in header; side-by-side content editing; SEO-friendly URL prefixes (/en/, /pt/)"),
+    ("\u2699\ufe0f", "Custom CMS", "Admin Panel",
+     "WYSIWYG editor, media library, menu manager, role-based access, content scheduling, revision history"),
+    ("\U0001F4C1", "Document Repository", "Secure",
+     "Categorised library with search/filter, access controls, bulk upload, download tracking"),
+    ("\U0001F4F0", "News & Events", "Dynamic",
+     "Article publishing, events calendar, conference/meeting registration functionality"),
+    ("\U0001F4E7", "Newsletter", "Mailing List",
+     "Subscription with email verification, subscriber management, SendGrid/Mailchimp integration"),
+    ("\U0001F4F1", "Social Media", "Integration",
+     "Live feed widgets, share buttons, Open Graph meta tags for Facebook, LinkedIn, Instagram, YouTube, X, TikTok"),
+    ("\U0001F4DD", "Sub-pages & Forms", "Dynamic",
+     "Template-based page creation for projects, tenders, job applications; custom forms builder"),
+    ("\U0001F4CA", "Analytics", "Built-in",
+     "Visitor dashboard with geographic data, exportable reports, Google Analytics integration"),
+    ("\U0001F50D", "Search", "Full-text",
+     "Cross-content search with filters by type, language, date; search analytics"),
+]
+
+MIGRATION_STEPS = [
+    ("1", "AUDIT", "Catalogue all existing content (pages, documents, images, media)"),
+    ("2", "PRIORITISE", "Work with BCC to identify content to migrate, update, or retire"),
+    ("3", "MIGRATE", "Transfer all approved content with proper categorisation"),
+    ("4", "VERIFY", "Cross-check migrated content for accuracy and completeness"),
+    ("5", "REDIRECT", "Implement URL redirects to preserve SEO and prevent broken links"),
+]
+
+MIGRATION_COLORS = ["003D6B", "005A9C", "0073B7", "009B72", "00B386"]
+
+SECURITY_ITEMS = [
+    "SSL/TLS encryption (HTTPS) on all pages",
+    "Web Application Firewall (WAF) via Cloudflare",
+    "Regular automated security scans",
+    "Input validation and sanitisation against SQL injection and XSS",
+    "Secure authentication with password hashing (bcrypt)",
+    "Role-based access control for CMS users",
+    "Automated daily backups with off-site storage",
+    "DDoS protection via Cloudflare",
+    "Content Security Policy (CSP) headers",
+    "Regular security patches and updates",
+]
+
+HOSTING = [
+    ["Primary Server", "Cloud VPS \u2013 4+ vCPUs, 8GB+ RAM, SSD storage"],
+    ["Database", "Managed PostgreSQL with automated backups"],
+    ["CDN", "Cloudflare for global delivery and DDoS protection"],
+    ["Backups", "Daily automated, 30-day retention, geographically separate"],
+    ["Uptime SLA", "99.9% uptime guarantee"],
+    ["Monitoring", "24/7 server monitoring with automated alerts"],
+]
+
+TRAINING = [
+    ["CMS Administration", "Creating/editing pages, managing documents, publishing news", "1 day"],
+    ["Media Management", "Uploading and organising images, videos, and documents", "0.5 day"],
+    ["User & Access Mgmt", "Managing user accounts and roles", "0.5 day"],
+    ["Analytics & Reporting", "Using the analytics dashboard and generating reports", "0.5 day"],
+    ["Troubleshooting", "Common issues and how to resolve them", "0.5 day"],
+]
+
+PHASES = [
+    ("1", "Discovery & Planning", "Weeks 1\u20132", [
+        "Inception meeting with BCC Secretariat",
+        "Audit of current website structure, content, and functionality",
+        "Stakeholder requirements gathering",
+        "Content inventory and migration planning",
+        "Technical architecture design",
+        "Inception Report delivery",
+    ]),
+    ("2", "Design", "Weeks 3\u20135", [
+        "Development of three design concepts",
+        "Presentation to BCC for review and selection",
+        "Refinement of selected design",
+        "Responsive layouts for desktop, tablet, mobile",
+    ]),
+    ("3", "Development", "Weeks 5\u20139", [
+        "Custom CMS core development",
+        "Front-end development (all pages and templates)",
+        "Bilingual architecture implementation",
+        "Document repository, newsletter, social media, forms, analytics modules",
+    ]),
+    ("4", "Migration & Testing", "Weeks 9\u201311", [
+        "Content migration from existing website",
+        "Functionality, speed, responsiveness, and security testing",
+        "User acceptance testing with BCC staff",
+        "Bug fixes and refinements",
+    ]),
+    ("5", "Launch & Training", "Weeks 11\u201312", [
+        "Final deployment to production servers",
+        "DNS migration, SSL setup, URL redirects",
+        "Staff training sessions (3 days in Swakopmund)",
+        "User manual and technical documentation delivery",
+    ]),
+    ("6", "Hosting & Maintenance", "Years 1\u20133", [
+        "24/7 server monitoring and security patches",
+        "Monthly maintenance and quarterly performance reports",
+        "Visitor analytics reports on request",
+        "Ongoing technical support via email and phone",
+    ]),
+]
+
+PHASE_COLORS = ["003D6B", "005A9C", "0073B7", "009B72", "00B386", "D4A017"]
+
+# ── Section D: Work Plan ──
+WORKPLAN = [
+    ["Week 1", "Inception meeting; stakeholder consultation; website audit", "Inception Report"],
+    ["Week 2", "Requirements finalisation; content inventory; architecture planning", "Requirements Document"],
+    ["Week 3", "Wireframe development; design concept 1", "Wireframes"],
+    ["Week 4", "Design concepts 2 and 3", "Three Design Concepts"],
+    ["Week 5", "Design presentation; feedback; refinement and approval", "Approved Final Design"],
+    ["Week 6", "CMS core development; database design; bilingual setup", "Progress Report"],
+    ["Week 7", "Front-end development; page templates; responsive layouts", "Progress Report"],
+    ["Week 8", "Document repository; newsletter; social media integration", "Progress Report"],
+    ["Week 9", "Forms, registration, analytics modules; CMS admin completion", "Progress Report"],
+    ["Week 10", "Content migration; internal testing and QA", "Migration & Test Report"],
+    ["Week 11", "User acceptance testing; bug fixes and refinements", "UAT Sign-off"],
+    ["Week 12", "Deployment; DNS migration; staff training; documentation", "Live Website; Manuals"],
+    ["Months 4\u201336", "Hosting, maintenance, security updates, and support", "Monthly/Quarterly Reports"],
+]
+
+# Phase data: (name, start, end, color); start/end are unit numbers or ISO dates
+GANTT_PHASES = [
+    ("Discovery & Planning", 1, 2, "003D6B"),
+    ("Design", 3, 5, "005A9C"),
+    ("Development", 5, 9, "0073B7"),
+    ("Migration & Testing", 9, 11, "009B72"),
+    ("Launch & Training", 11, 12, "00B386"),
+    ("Hosting & Maintenance", 1, 12, "FFF3CD"),  # ongoing, in light yellow
+]
+
+# Gantt timeline: granularity is "week" or "day"; start (ISO date) anchors
+# dated phases and defaults to the earliest phase start
+GANTT = {"granularity": "week", "start": None}
+
+# ── Section E: Financial Proposal ──
+PROF_FEES = [
+    ["", "Discovery & Planning", ""],
+    ["1.1", "Inception meeting and stakeholder consultation", "5,000.00"],
+    ["1.2", "Current website audit and requirements analysis", "8,000.00"],
+    ["1.3", "Content inventory and migration planning", "5,000.00"],
+    ["", "Subtotal: Discovery & Planning", "18,000.00"],
+    ["", "Website Design", ""],
+    ["2.1", "Three (3) design concepts (wireframes + mockups)", "20,000.00"],
+    ["2.2", "Design refinement and responsive layouts", "8,000.00"],
+    ["", "Subtotal: Design", "28,000.00"],
+    ["", "Website Development", ""],
+    ["3.1", "Custom CMS development (admin panel, editors, media library)", "35,000.00"],
+    ["3.2", "Front-end development (pages, templates, responsive)", "20,000.00"],
+    ["3.3", "Bilingual architecture (English/Portuguese)", "8,000.00"],
+    ["3.4", "Document repository module", "8,000.00"],
+    ["3.5", "Newsletter/mailing list module", "5,000.00"],
+    ["3.6", "Social media integration", "3,000.00"],
+    ["3.7", "Forms, registration, and sub-page creation module", "7,000.00"],
+    ["3.8", "Visitor analytics module", "5,000.00"],
+    ["3.9", "Search functionality", "3,000.00"],
+    ["", "Subtotal: Development", "94,000.00"],
+    ["", "Content Migration & Testing", ""],
+    ["4.1", "Content migration from existing website", "8,000.00"],
+    ["4.2", "Quality assurance, testing, and bug fixing", "7,000.00"],
+    ["4.3", "Security testing and hardening", "3,000.00"],
+    ["", "Subtotal: Migration & Testing", "18,000.00"],
+    ["", "Training & Handover", ""],
+    ["5.1", "Staff training (3 days on-site in Swakopmund)", "8,000.00"],
+    ["5.2", "User manual and video tutorials", "4,000.00"],
+    ["5.3", "Final technical documentation", "3,000.00"],
+    ["", "Subtotal: Training & Handover", "15,000.00"],
+]
+
+OTHER_COSTS = [
+    ["6.1", "Cloud hosting \u2013 BCC Website (Year 1)", "12,000.00"],
+    ["6.2", "Cloud hosting \u2013 BCC Website (Year 2)", "12,000.00"],
+    ["6.3", "Cloud hosting \u2013 BCC Website (Year 3)", "12,000.00"],
+    ["6.4", "Cloud hosting \u2013 BCLME RIIMS (Year 1)", "8,000.00"],
+    ["6.5", "Cloud hosting \u2013 BCLME RIIMS (Year 2)", "8,000.00"],
+    ["6.6", "Cloud hosting \u2013 BCLME RIIMS (Year 3)", "8,000.00"],
+    ["6.7", "Domain and SSL certificates (3 years)", "3,000.00"],
+    ["6.8", "CDN service \u2013 Cloudflare (3 years)", "0.00"],
+    ["6.9", "Monthly maintenance & security (36 months x NAD 500)", "18,000.00"],
+    ["7.1", "Travel to Swakopmund (2 trips)", "6,000.00"],
+    ["7.2", "Accommodation (6 nights)", "6,000.00"],
+]
+
+# Other-cost groups for the budget breakdown, keyed by the item number prefix:
+# prefix -> (overview label, bar label, bar colour)
+COST_GROUPS = {
+    "6": ("Hosting & Maintenance", "Hosting (3 Yrs)", "009B72"),
+    "7": ("Travel", "Travel", "D4A017"),
+}
+
+VAT_RATE = 15
+
+# ── Section F: References ──
+# A reference may also list "screenshots": [[caption, image path], ...]
+REFERENCES = [
+    {
+        "title": "Reference 1: Angula Consulting Website",
+        "color": "003D6B",
+        "details": [
+            ("Project:", "Design and development of the Angula Consulting corporate website"),
+            ("URL:", "www.angulaconsulting.com"),
+            ("Description:", "Full design and development of a professional consulting firm website showcasing services, portfolio, and contact capabilities. Built with modern responsive design principles and optimised for performance and SEO."),
+            ("Year:", "[INSERT YEAR]"),
+            ("Technologies:", "[INSERT: e.g., React, HTML/CSS/JS, etc.]"),
+        ],
+    },
+    {
+        "title": "Reference 2: OndyPOS Website & System",
+        "color": "0073B7",
+        "details": [
+            ("Project:", "Design and development of the OndyPOS point-of-sale system and website"),
+            ("URL:", "www.ondypos.com"),
+            ("Description:", "Full-stack development of OndyPOS, a comprehensive point-of-sale and inventory management web application, along with its marketing website. Demonstrates expertise in custom application development, database design, user authentication, and intuitive admin interfaces \u2013 skills directly transferable to the BCC custom CMS requirement."),
+            ("Year:", "[INSERT YEAR]"),
+            ("Contact:", "[INSERT CLIENT CONTACT NAME, PHONE, EMAIL]"),
+            ("Technologies:", "[INSERT: e.g., React, Node.js, PostgreSQL, etc.]"),
+        ],
+    },
+    {
+        "title": "Reference 3: GovRecruit Namibia Website",
+        "color": "009B72",
+        "details": [
+            ("Project:", "Design and development of the GovRecruit Namibia platform"),
+            ("URL:", "[INSERT URL]"),
+            ("Description:", "Design and development of the GovRecruit Namibia platform, a web-based government recruitment and job application system. Involved building user-facing pages, application submission forms, document upload functionality, and an administrative back-end \u2013 directly relevant to BCC\u2019s requirement for sub-pages for job applications, tender submissions, and conference registrations."),
+            ("Year:", "[INSERT YEAR]"),
+            ("Contact:", "[INSERT CLIENT CONTACT NAME, PHONE, EMAIL]"),
+            ("Technologies:", "[INSERT: e.g., React, Django, PostgreSQL, etc.]"),
+        ],
+    },
+]
+
+# ── Annexures ──
+ANNEXURES = [
+    ("Annexure 1", "Curriculum Vitae of Job Angula (Principal Consultant)", "\u2610"),
+    ("Annexure 2", "Certified copy of qualifications", "\u2610"),
+    ("Annexure 3", "Business registration certificate", "\u2610"),
+    ("Annexure 4", "Reference letters / testimonials from clients", "\u2610"),
+    ("Annexure 5", "Portfolio screenshots of referenced projects", "\u2610"),
+]
+
+# Annexure 5 portfolio screenshots: [caption, image path] rows, embedded after
+# the checklist and downscaled to IMAGE_DPI at their printed width
+SCREENSHOTS = []
+IMAGE_DPI = 150
+
+FOOTER = (
+    "This proposal is submitted by Job Angula Technology Consulting in response to the "
+    "BCC Call for Expression of Interest for the Revamping and Re-Designing of the BCC Website, "
+    "February 2026."
+)
+
+
+def default_content():
+    """Return a fresh, independently mutable copy of the default proposal content."""
+    return copy.deepcopy({
+        "cover": COVER,
+        "toc_items": TOC_ITEMS,
+        "letter": LETTER,
+        "competencies": COMPETENCIES,
+        "subcontractors": SUBCONTRACTORS,
+        "business_details": BUSINESS_DETAILS,
+        "requirements": REQUIREMENTS,
+        "cms_comparison": CMS_COMPARISON,
+        "tech_stack": TECH_STACK,
+        "concepts": CONCEPTS,
+        "features": FEATURES,
+        "migration_steps": MIGRATION_STEPS,
+        "migration_colors": MIGRATION_COLORS,
+        "security_items": SECURITY_ITEMS,
+        "hosting": HOSTING,
+        "training": TRAINING,
+        "phases": PHASES,
+        "phase_colors": PHASE_COLORS,
+        "workplan": WORKPLAN,
+        "gantt_phases": GANTT_PHASES,
+        "gantt": GANTT,
+        "prof_fees": PROF_FEES,
+        "other_costs": OTHER_COSTS,
+        "cost_groups": COST_GROUPS,
+        "vat_rate": VAT_RATE,
+        "references": REFERENCES,
+        "annexures": ANNEXURES,
+        "screenshots": SCREENSHOTS,
+        "image_dpi": IMAGE_DPI,
+        "footer": FOOTER,
+    })
@@ -0,0 +1,242 @@
+"""
+External content files (JSON, YAML or TOML).
+
+A content file holds any subset of the keys of ``default_content()``; missing
+keys keep their defaults. Files are validated against the shape of the
+defaults and the parsed result is cached: in memory by path and
+(mtime, size), and on disk as JSON keyed by the SHA-256 of the file bytes and
+the package source when a cache directory is given, so watch rebuilds and
+batch workers skip re-parsing a file that has not changed and a new version
+validates it again.
+
+YAML needs PyYAML; TOML uses the standard library ``tomllib`` (Python 3.11+).
+"""
+
+import copy
+import datetime
+import hashlib
+import json
+import os
+import re
+
+from .build import parse_amount
+from .content import default_content
+from .gantt import MAX_UNITS, phase_spans
+from .incremental import code_version
+from .package import atomic_write
+
+FORMATS = {".json": "json", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml"}
+
+# Table-like keys whose rows must keep the arity of the default rows
+ROW_KEYS = (
+    "toc_items", "subcontractors", "business_details", "requirements", "cms_comparison",
+    "tech_stack", "concepts", "features", "migration_steps", "hosting", "training",
+    "phases", "workplan", "gantt_phases", "prof_fees", "other_costs", "annexures",
+)
+
+# Row keys whose last column is an amount
+AMOUNT_KEYS = ("prof_fees", "other_costs")
+
+# Keys of a ``references`` entry: required, then optional
+REFERENCE_KEYS = ("title", "color", "details")
+REFERENCE_OPTIONAL = ("screenshots",)
+
+_COLOR = re.compile(r"[0-9A-Fa-f]{6}")
+
+# path -> (mtime_ns, size, sha256, data)
+_MEMORY = {}
+
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"{path}: unsupported content format {ext!r} "
+                         f"(expected one of {', '.join(sorted(FORMATS))})")
+    return FORMATS[ext]
+
+def _parse(raw, fmt, path):
+    if fmt == "json":
+        return json.loads(raw)
+    if fmt == "yaml":
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError(f"{path}: reading YAML content needs PyYAML (pip install pyyaml)")
+        return yaml.safe_load(raw)
+    import tomllib
+    return tomllib.loads(raw.decode("utf-8"))
+
+def _check(value, default, where, width=None):
+    """Raise ``ValueError`` if ``value`` does not have the shape of ``default``."""
+    if isinstance(default, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"{where}: expected a mapping, got {type(value).__name__}")
+        for key, item in value.items():
+            if key in default:
+                _check(item, default[key], f"{where}.{key}")
+    elif isinstance(default, (list, tuple)):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"{where}: expected a list, got {type(value).__name__}")
+        if width is not None:
+            for i, row in enumerate(value):
+                if not isinstance(row, (list, tuple)) or len(row) != width:
+                    raise ValueError(f"{where}[{i}]: expected a row of {width} values")
+    elif isinstance(default, str) and not isinstance(value, str):
+        raise ValueError(f"{where}: expected text, got {type(value).__name__}")
+    elif isinstance(default, (int, float)) and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+        raise ValueError(f"{where}: expected a number, got {type(value).__name__}")
+
+def _check_amounts(rows, where):
+    """Raise ``ValueError`` unless the last column of every row is a blank or "12,345.00" amount."""
+    for i, row in enumerate(rows):
+        amount = row[-1]
+        try:
+            valid = isinstance(amount, str) and parse_amount(amount).is_finite()
+        except ArithmeticError:  # decimal.InvalidOperation
+            valid = False
+        if not valid:
+            raise ValueError(f"{where}[{i}]: {amount!r} is not an amount")
+
+def _check_rows(rows, where, width, kinds=(str,)):
+    if not isinstance(rows, (list, tuple)):
+        raise ValueError(f"{where}: expected a list, got {type(rows).__name__}")
+    for i, row in enumerate(rows):
+        if not isinstance(row, (list, tuple)) or len(row) != width or not all(isinstance(v, kinds) for v in row):
+            raise ValueError(f"{where}[{i}]: expected a row of {width} text values")
+
+def _check_color(value, where):
+    if not isinstance(value, str) or not _COLOR.fullmatch(value):
+        raise ValueError(f"{where}: {value!r} is not an RRGGBB colour")
+
+def _check_references(refs, where):
+    """Raise ``ValueError`` unless every entry has the keys and value types ``build`` reads."""
+    for i, ref in enumerate(refs):
+        at = f"{where}[{i}]"
+        if not isinstance(ref, dict):
+            raise ValueError(f"{at}: expected a mapping, got {type(ref).__name__}")
+        missing = [key for key in REFERENCE_KEYS if key not in ref]
+        unknown = sorted(set(ref) - set(REFERENCE_KEYS) - set(REFERENCE_OPTIONAL))
+        if missing or unknown:
+            raise ValueError(f"{at}: " + "; ".join(
+                part for part in (missing and f"missing {', '.join(missing)}",
+                                  unknown and f"unknown key(s) {', '.join(unknown)}") if part))
+        if not isinstance(ref["title"], str):
+            raise ValueError(f"{at}.title: expected text, got {type(ref['title']).__name__}")
+        _check_color(ref["color"], f"{at}.color")
+        _check_rows(ref["details"], f"{at}.details", 2)
+        if "screenshots" in ref:
+            _check_rows(ref["screenshots"], f"{at}.screenshots", 2)
+
+def _check_gantt(phases, options, where):
+    """Raise ``ValueError`` unless ``phases`` resolve to a chart of at most ``MAX_UNITS`` units."""
+    try:
+        spans = phase_spans(phases, options.get("granularity", "week"), options.get("start"))
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{where}: {exc}") from None
+    for i, (name, first, last, color) in enumerate(spans):
+        if not isinstance(name, str):
+            raise ValueError(f"{where}[{i}]: expected a phase name, got {type(name).__name__}")
+        _check_color(color, f"{where}[{i}]")
+        if last < first:
+            raise ValueError(f"{where}[{i}]: phase ends before it starts")
+        if last > MAX_UNITS:
+            raise ValueError(f"{where}[{i}]: phase ends at unit {last}; a chart has at most {MAX_UNITS}")
+    if max((last for _, _, last, _ in spans), default=0) < 1:
+        raise ValueError(f"{where}: no phase falls on or after the chart start")
+
+def validate(data, path="content"):
+    """Check a parsed content mapping against ``default_content()``; return it."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: top level must be a mapping")
+    defaults = default_content()
+    unknown = sorted(set(data) - set(defaults))
+    if unknown:
+        raise ValueError(f"{path}: unknown content key(s): {', '.join(unknown)}")
+    for key, value in data.items():
+        default = defaults[key]
+        if value is not None and default is not None:
+            width = len(default[0]) if key in ROW_KEYS and default else None
+            _check(value, default, f"{path}:{key}", width)
+            if key in AMOUNT_KEYS:
+                _check_amounts(value, f"{path}:{key}")
+    if data.get("references") is not None:
+        _check_references(data["references"], f"{path}:references")
+    if data.get("gantt_phases") is not None or data.get("gantt") is not None:
+        phases = data.get("gantt_phases")
+        _check_gantt(defaults["gantt_phases"] if phases is None else phases,
+                     {**defaults["gantt"], **(data.get("gantt") or {})}, f"{path}:gantt_phases")
+    return data
+
+def json_default(value):
+    """``json.dumps`` fallback for the dates YAML and TOML content may hold (as ISO strings)."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+def _disk_path(cache_dir, sha):
+    return os.path.join(cache_dir, f"content-{sha}.json")
+
+def _read_disk(cache_dir, sha):
+    try:
+        with open(_disk_path(cache_dir, sha), "rb") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _write_disk(cache_dir, sha, data):
+    os.makedirs(cache_dir, exist_ok=True)
+    with atomic_write(_disk_path(cache_dir, sha)) as fh:
+        fh.write(json.dumps(data, ensure_ascii=False, default=json_default).encode("utf-8"))
+
+def load_content(path, cache_dir=None):
+    """Return the validated content overrides in ``path`` (a fresh copy each call)."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    cached = _MEMORY.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[3])
+
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    sha = hashlib.sha256(code_version().encode() + b"\0" + raw).hexdigest()
+    if cached and cached[2] == sha:
+        data = cached[3]  # touched but unchanged
+    else:
+        data = _read_disk(cache_dir, sha) if cache_dir else None
+        if data is None:
+            data = validate(_parse(raw, _format(path), path), path)
+            # Through JSON so a fresh parse and a cached one agree (dates become ISO strings)
+            data = json.loads(json.dumps(data, default=json_default))
+            if cache_dir:
+                _write_disk(cache_dir, sha, data)
+    _MEMORY[path] = (st.st_mtime_ns, st.st_size, sha, data)
+    return copy.deepcopy(data)
+
+def merge_content(base, overrides):
+    """Overlay ``overrides`` on ``base`` the way ``resolve_content`` overlays the defaults."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = {**merged[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+def dump_content(path, data=None):
+    """Write ``data`` (default: the built-in content) as a JSON or YAML content file.
+
+    The file is replaced atomically; on any error it is left as it was.
+    """
+    data = default_content() if data is None else data
+    fmt = _format(path)
+    if fmt == "toml":
+        raise ValueError(f"{path}: writing TOML is not supported; use JSON or YAML")
+    if fmt == "json":
+        text = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    else:
+        import yaml
+        # Tuples (e.g. competency cards) are written as plain lists
+        text = yaml.safe_dump(json.loads(json.dumps(data)), allow_unicode=True,
+                              sort_keys=False, width=100)
+    with atomic_write(path) as fh:
+        fh.write(text.encode("utf-8"))
@@ -0,0 +1,177 @@
+"""
+Stream text out of a .docx for indexing, without loading it into python-docx.
+
+    python -m proposal.extract proposal.docx                 # Markdown to stdout
+    python -m proposal.extract proposal.docx -f text -o x.txt --stats
+
+``word/document.xml`` is read straight from the zip with ``lxml.etree.iterparse``.
+Each top-level paragraph or table is emitted as soon as its end tag is seen
+and then cleared together with the siblings before it, so memory stays flat
+however long the document is. Heading levels come from the paragraph style
+(``ProposalHeading1``/``Heading1`` ...); tables keep their rows and cells.
+"""
+
+import argparse
+import re
+import sys
+import zipfile
+
+from lxml import etree
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+P, TBL, TR, TC = W + "p", W + "tbl", W + "tr", W + "tc"
+T, TAB, BR, CR, PSTYLE = W + "t", W + "tab", W + "br", W + "cr", W + "pStyle"
+
+_HEADING_STYLE = re.compile(r"^(?:Proposal)?Heading(\d)$")
+_BULLET_STYLES = ("ListBullet", "ListParagraph", "ListNumber")
+
+
+def _paragraph_text(p):
+    parts = []
+    for el in p.iter(T, TAB, BR, CR):
+        if el.tag == T:
+            parts.append(el.text or "")
+        elif el.tag == TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
+
+def _paragraph_style(p):
+    style = p.find(f"{W}pPr/{PSTYLE}")
+    return style.get(W + "val") if style is not None else None
+
+def _cell_text(tc):
+    """Text of a cell, paragraphs separated by newlines (nested tables included)."""
+    return "\n".join(t for t in (_paragraph_text(p) for p in tc.iter(P)) if t)
+
+def _release(el):
+    """Clear a finished top-level element and the already-processed siblings before it."""
+    el.clear()
+    parent = el.getparent()
+    while el.getprevious() is not None:
+        del parent[0]
+
+def iter_blocks(source):
+    """Yield ``("heading", level, text)``, ``("bullet", None, text)``,
+    ``("para", None, text)`` or ``("table", None, rows)`` in document order.
+
+    ``source`` is a path or binary file object of a .docx package.
+    """
+    with zipfile.ZipFile(source) as zf, zf.open("word/document.xml") as xml:
+        depth = 0  # table nesting
+        rows, row = [], []
+        for event, el in etree.iterparse(xml, events=("start", "end"), tag=(P, TBL, TR, TC)):
+            tag = el.tag
+            if tag == TBL:
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 0:
+                    yield "table", None, rows
+                    rows = []
+                    _release(el)
+            elif event == "start":
+                continue
+            elif depth == 0 and tag == P:
+                text = _paragraph_text(el)
+                style = _paragraph_style(el) or ""
+                heading = _HEADING_STYLE.match(style)
+                if style == "Title":
+                    yield "heading", 0, text
+                elif heading and text.strip():
+                    yield "heading", int(heading.group(1)), text
+                elif style in _BULLET_STYLES:
+                    yield "bullet", None, text
+                else:
+                    yield "para", None, text
+                _release(el)
+            elif depth == 1 and tag == TC:
+                row.append(_cell_text(el))
+            elif depth == 1 and tag == TR:
+                rows.append(row)
+                row = []
+
+def _md_cell(text):
+    return text.replace("|", "\\|").replace("\n", "<br>")
+
+def _md_table(rows):
+    width = max(len(r) for r in rows)
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    lines = ["| " + " | ".join(map(_md_cell, rows[0])) + " |",
+             "|" + "|".join("---" for _ in range(width)) + "|"]
+    lines += ["| " + " | ".join(map(_md_cell, r)) + " |" for r in rows[1:]]
+    return "\n".join(lines)
+
+def _render(kind, level, value, markdown):
+    """One block of ``iter_blocks`` as Markdown or plain text; ``None`` if it is empty."""
+    if kind == "table":
+        if not value:
+            return None
+        if markdown:
+            return _md_table(value)
+        return "\n".join("\t".join(c.replace("\n", " ") for c in r) for r in value)
+    if not value.strip():
+        return None
+    if kind == "heading":
+        return ("#" * (level + 1) + " " + value.replace("\n", " ")) if markdown else value
+    if kind == "bullet":
+        return ("- " if markdown else "\u2022 ") + value
+    return value.replace("\n", "  \n") if markdown else value
+
+def _words(kind, value):
+    """Words in the run text of one block, without Markdown, bullet or table markup."""
+    if kind == "table":
+        return sum(len(cell.split()) for row in value for cell in row)
+    return len(value.split())
+
+def iter_text(source, fmt="markdown"):
+    """Yield the document as Markdown or plain-text blocks (no trailing blank lines)."""
+    markdown = fmt == "markdown"
+    for kind, level, value in iter_blocks(source):
+        block = _render(kind, level, value, markdown)
+        if block is not None:
+            yield block
+
+def extract(source, out, fmt="markdown"):
+    """Write the text of ``source`` to the text stream ``out``; return counts.
+
+    ``words`` counts the document's own text, so it is the same for either
+    ``fmt``; ``characters`` counts what was written.
+    """
+    stats = {"blocks": 0, "words": 0, "characters": 0}
+    markdown = fmt == "markdown"
+    for kind, level, value in iter_blocks(source):
+        block = _render(kind, level, value, markdown)
+        if block is None:
+            continue
+        out.write(("\n\n" if stats["blocks"] else "") + block)
+        stats["blocks"] += 1
+        stats["words"] += _words(kind, value)
+        stats["characters"] += len(block)
+    if stats["blocks"]:
+        out.write("\n")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract Markdown or text from a .docx")
+    parser.add_argument("docx")
+    parser.add_argument("-f", "--format", choices=("markdown", "text"), default="markdown")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--stats", action="store_true", help="print block and word counts to stderr")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            stats = extract(args.docx, fh, args.format)
+    else:
+        stats = extract(args.docx, sys.stdout, args.format)
+    if args.stats:
+        print(f"{stats['blocks']} blocks, {stats['words']} words, "
+              f"{stats['characters']} characters", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Pre-parsed XML fragment cache for cell shading, cell borders and paragraph borders.
+
+Each distinct ``w:shd`` / ``w:tcBorders`` / ``w:pBdr`` is parsed once and every
+later request gets a deep copy of the cached element, which is much cheaper
+than formatting and parsing a fresh XML string per cell.
+"""
+
+import copy
+
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
+
+
+class FragmentCache:
+    """Parsed fragments keyed by (kind, colour, size, edges), with hit/miss counters."""
+
+    def __init__(self):
+        self._fragments = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, xml):
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            self.misses += 1
+            fragment = self._fragments[key] = parse_xml(xml())
+        else:
+            self.hits += 1
+        return copy.deepcopy(fragment)
+
+    def shading(self, color_hex):
+        """Return a ``w:shd`` filling with ``color_hex``."""
+        return self._get(
+            ("shd", color_hex, None, None),
+            lambda: f'<w:shd {nsdecls("w")} w:fill="{color_hex}"/>',
+        )
+
+    def cell_borders(self, edges):
+        """Return a ``w:tcBorders``; ``edges`` is a sequence of (edge, val, sz, color)."""
+        edges = tuple(edges)
+        return self._get(
+            ("tcBorders", None, None, edges),
+            lambda: f'<w:tcBorders {nsdecls("w")}>' + "".join(
+                f'<w:{edge} w:val="{val}" w:sz="{sz}" w:space="0" w:color="{color}"/>'
+                for edge, val, sz, color in edges
+            ) + '</w:tcBorders>',
+        )
+
+    def paragraph_border(self, edge, sz, space, color):
+        """Return a ``w:pBdr`` with a single line on ``edge``."""
+        return self._get(
+            ("pBdr", color, sz, ((edge, space),)),
+            lambda: f'<w:pBdr {nsdecls("w")}>'
+                    f'<w:{edge} w:val="single" w:sz="{sz}" w:space="{space}" w:color="{color}"/>'
+                    f'</w:pBdr>',
+        )
+
+    def stats(self):
+        """Return the counters for profiling output."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fragments": len(self._fragments),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self._fragments.clear()
+        self.reset_stats()
+
+
+# Shared by all helpers; parsed fragments are immutable templates, so one
+# cache per process is safe across builds.
+FRAGMENTS = FragmentCache()
@@ -0,0 +1,126 @@
+"""
+Run-length Gantt chart renderer.
+
+The timeline has one grid column per time unit (week or day), but each phase
+row is written as at most three cells: the idle span before the phase, the
+phase itself and the idle span after it, each merged with ``w:gridSpan``. The
+header is run-length encoded the same way (one cell per month for day charts),
+so the number of cells grows with the number of phases, not with
+phases x time units.
+"""
+
+import datetime
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
+from docx.shared import Cm, Emu
+
+from .tables import cell_xml, set_table_style
+
+IDLE_FILL = "F8F8F8"
+GRANULARITIES = ("week", "day")
+# Longest timeline drawn: a year of days (one grid column per unit)
+MAX_UNITS = 366
+
+
+def _as_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value)
+
+def _unit_index(value, origin, granularity):
+    """1-based unit index of ``value``: ints pass through, dates count from ``origin``."""
+    if isinstance(value, int):
+        return value
+    days = (_as_date(value) - origin).days
+    return days // 7 + 1 if granularity == "week" else days + 1
+
+def _origin(phases, start):
+    """Date that unit 1 starts on: ``start``, else the earliest dated phase start."""
+    if start is not None:
+        return _as_date(start)
+    dated = [first for _, first, _, _ in phases if not isinstance(first, int)]
+    return min(map(_as_date, dated)) if dated else None
+
+def phase_spans(phases, granularity="week", start=None):
+    """Resolve phases to ``(name, first_unit, last_unit, color)`` with 1-based units.
+
+    Phase bounds may be unit numbers or dates (``datetime.date`` or ISO
+    strings). Dates are counted from ``start``, defaulting to the earliest
+    phase start.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"granularity must be one of {GRANULARITIES}, not {granularity!r}")
+    origin = _origin(phases, start)
+    return [(name, _unit_index(first, origin, granularity),
+             _unit_index(last, origin, granularity), color)
+            for name, first, last, color in phases]
+
+def _header_runs(units, granularity, origin):
+    """Run-length header cells as ``(label, span)``."""
+    if granularity == "week":
+        return [(f"W{w}", 1) for w in range(1, units + 1)]
+    if origin is None:
+        # Undated day chart: group days into weeks
+        return [(f"W{w // 7 + 1}", min(7, units - w)) for w in range(0, units, 7)]
+    runs = []
+    for day in range(units):
+        label = (origin + datetime.timedelta(days=day)).strftime("%b %Y")
+        if runs and runs[-1][0] == label:
+            runs[-1][1] += 1
+        else:
+            runs.append([label, 1])
+    return [tuple(run) for run in runs]
+
+def chart_spans(phases, granularity="week", start=None):
+    """``phase_spans`` checked for drawing; return ``(spans, units)``.
+
+    Phases starting before ``start`` are cut off at the first unit (one that
+    ends before it gets ``first = 1, last = 0``, an empty row).
+    """
+    spans = phase_spans(phases, granularity, start)
+    for name, first, last, _ in spans:
+        if last < first:
+            raise ValueError(f"Gantt phase {name!r} ends before it starts")
+    units = max(last for _, _, last, _ in spans)
+    if units < 1:
+        raise ValueError("no Gantt phase falls on or after the chart start")
+    if units > MAX_UNITS:
+        raise ValueError(f"Gantt chart of {units} units; at most {MAX_UNITS} are drawn")
+    return [(name, max(first, 1), max(last, 0), color) for name, first, last, color in spans], units
+
+def add_gantt_chart(doc, phases, granularity="week", start=None, name_width=3.5):
+    """Append a Gantt table for ``phases`` (see ``chart_spans``) and return it."""
+    spans, units = chart_spans(phases, granularity, start)
+
+    table = doc.add_table(rows=0, cols=1 + units)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    set_table_style(table, "ProposalTable", True, False, False)
+    # Fixed layout so Word does not measure hundreds of day columns on open
+    table.autofit = False
+    tbl = table._tbl
+
+    name_tw = Cm(name_width).twips
+    unit_tw = max(1, (Emu(doc._block_width).twips - name_tw) // units)
+    for i, grid_col in enumerate(tbl.tblGrid.gridCol_lst):
+        grid_col.w = Emu(Cm(name_width)) if i == 0 else Emu(unit_tw * 635)
+
+    xml = [f"<w:tbl {nsdecls('w')}>", "<w:tr>",
+           cell_xml("Phase", "GanttHeader", None, "center", name_tw)]
+    for label, span in _header_runs(units, granularity, _origin(phases, start)):
+        xml.append(cell_xml(label, "GanttHeader", None, "center", unit_tw * span, span))
+    xml.append("</w:tr>")
+
+    for name, first, last, color in spans:
+        xml.append("<w:tr>")
+        xml.append(cell_xml(name, "GanttLabel", None, None, name_tw))
+        for fill, span in ((IDLE_FILL, first - 1), (color, last - first + 1), (IDLE_FILL, units - last)):
+            if span > 0:
+                xml.append(cell_xml("", None, fill, None, unit_tw * span, span))
+        xml.append("</w:tr>")
+    xml.append("</w:tbl>")
+
+    for tr in parse_xml("".join(xml)).iterchildren():
+        tbl.append(tr)
+    return table
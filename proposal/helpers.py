@@ -0,0 +1,209 @@
+"""
+Colour palette and python-docx helper functions shared by every proposal section.
+"""
+
+import math
+
+from docx.shared import Cm, RGBColor, Emu
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
+
+from .fragments import FRAGMENTS
+from .layout import CELL_MARGIN, UNITS_PER_EM, text_width
+from .tables import build_table, cell_xml
+
+# ── Colour Palette (Ocean / BCC-inspired) ──
+DEEP_BLUE = RGBColor(0x00, 0x3D, 0x6B)      # Primary headings
+OCEAN_BLUE = RGBColor(0x00, 0x7B, 0xB8)      # Secondary headings
+LIGHT_BLUE = RGBColor(0xD6, 0xEA, 0xF8)      # Table header bg
+ACCENT_GREEN = RGBColor(0x00, 0x9B, 0x72)     # Accents / highlights
+DARK_GRAY = RGBColor(0x33, 0x33, 0x33)        # Body text
+MEDIUM_GRAY = RGBColor(0x66, 0x66, 0x66)      # Secondary text
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+TABLE_HEADER_BG = "0073B7"
+TABLE_ALT_ROW = "EBF5FB"
+ACCENT_BAR = "00639B"
+HIGHLIGHT_BG = "E8F8F5"
+SECTION_BG = "F0F7FF"
+
+# ── Helper Functions ──
+
+def set_cell_shading(cell, color_hex):
+    """Set background colour of a table cell."""
+    cell._tc.get_or_add_tcPr().append(FRAGMENTS.shading(color_hex))
+
+def set_cell_border(cell, **kwargs):
+    """Set borders on a cell."""
+    edges = [(edge, val.get("val", "single"), val.get("sz", "4"), val.get("color", "000000"))
+             for edge, val in kwargs.items()]
+    cell._tc.get_or_add_tcPr().append(FRAGMENTS.cell_borders(edges))
+
+def add_run(paragraph, text, style=None):
+    """Add a run tagged with a character style id from ``proposal.styles``."""
+    run = paragraph.add_run(text)
+    if style:
+        run._r.style = style
+    return run
+
+def add_styled_table(doc, headers, rows, col_widths=None):
+    """Add a professionally styled table."""
+    return build_table(
+        doc, rows, headers,
+        style="ProposalTableEven",
+        banded=True,
+        row_format=lambda r_idx, row: ("SmallText", None),
+        col_widths=col_widths,
+        autofit=True,
+    )
+
+def add_info_box(doc, title, content, bg_color=SECTION_BG):
+    """Add a highlighted information box using a single-cell table."""
+    table = doc.add_table(rows=1, cols=1)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    cell = table.rows[0].cells[0]
+    set_cell_shading(cell, bg_color.replace("#", ""))
+
+    borders = {"top": {"val": "single", "sz": "12", "color": ACCENT_BAR},
+               "bottom": {"val": "single", "sz": "4", "color": ACCENT_BAR},
+               "left": {"val": "single", "sz": "4", "color": ACCENT_BAR},
+               "right": {"val": "single", "sz": "4", "color": ACCENT_BAR}}
+    set_cell_border(cell, **borders)
+
+    add_run(cell.paragraphs[0], title, "StrongText")
+    add_run(cell.add_paragraph(), content, "SmallText")
+
+    return table
+
+def add_section_heading(doc, text, level=1):
+    """Add a coloured section heading (border and colours come from the style)."""
+    p = doc.add_paragraph()
+    p._p.style = f"ProposalHeading{level}"
+    p.add_run(text.upper() if level == 1 else text)
+    return p
+
+def add_body(doc, text):
+    """Add body paragraph."""
+    p = doc.add_paragraph()
+    p._p.style = "ProposalBody"
+    p.add_run(text)
+    return p
+
+def add_bullet(doc, text, bold_prefix=None):
+    """Add a bullet point, optionally with bold prefix."""
+    p = doc.add_paragraph(style='List Bullet')
+    if bold_prefix:
+        add_run(p, bold_prefix, "BoldText")
+    p.add_run(text)
+    return p
+
+def _text_cell_width(text, style_id):
+    """Twips a cell needs to hold ``text`` in character style ``style_id`` on one line."""
+    from .styles import CHARACTER_STYLES
+    _, size, _, bold, _ = CHARACTER_STYLES[style_id]
+    return math.ceil(text_width(text, bold) * size * 20 / UNITS_PER_EM) + 2 * CELL_MARGIN
+
+def add_bar_chart(doc, bars, label_width=4, bar_width=12):
+    """Add horizontal percentage bars, one row per ``(label, percentage, color)``.
+
+    All bars share one flat table. The grid has a column boundary at every
+    distinct fill width, so each bar is exactly three cells (label, filled,
+    empty) whose filled span ends at its exact percentage. The filled cell
+    holds the percentage, so it is never narrower than that label (a 0% bar
+    still shows "0%").
+    """
+    label_tw = Cm(label_width).twips
+    bar_tw = Cm(bar_width).twips
+    fills = [min(bar_tw, max(_text_cell_width(f" {pct}%", "BarValue"), round(float(pct) * bar_tw / 100)))
+             for _, pct, _ in bars]
+    edges = sorted({0, bar_tw, *fills})
+    col_of = {edge: i for i, edge in enumerate(edges)}
+
+    table = doc.add_table(rows=0, cols=len(edges))
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    table.autofit = False
+    grid = table._tbl.tblGrid.gridCol_lst
+    grid[0].w = Emu(Cm(label_width))
+    for grid_col, left, right in zip(grid[1:], edges, edges[1:]):
+        grid_col.w = Emu((right - left) * 635)
+
+    xml = [f"<w:tbl {nsdecls('w')}>"]
+    for (label, pct, color), filled in zip(bars, fills):
+        xml.append("<w:tr>")
+        xml.append(cell_xml(label, "BarLabel", None, None, label_tw))
+        if filled:
+            xml.append(cell_xml(f" {pct}%", "BarValue", color, None, filled, col_of[filled]))
+        if filled < bar_tw:
+            xml.append(cell_xml("", None, "E8E8E8", None, bar_tw - filled,
+                                 len(edges) - 1 - col_of[filled]))
+        xml.append("</w:tr>")
+    xml.append("</w:tbl>")
+
+    tbl = table._tbl
+    for tr in parse_xml("".join(xml)).iterchildren():
+        tbl.append(tr)
+    return table
+
+def add_progress_bar(doc, label, percentage, color=ACCENT_BAR):
+    """Add a single percentage bar (see ``add_bar_chart``)."""
+    return add_bar_chart(doc, [(label, percentage, color)])
+
+def add_icon_card_row(doc, cards):
+    """Add a row of icon cards (emoji + title + description) using a table."""
+    table = doc.add_table(rows=2, cols=len(cards))
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    for i, (icon, title, desc) in enumerate(cards):
+        # Icon + Title row
+        cell_top = table.rows[0].cells[i]
+        set_cell_shading(cell_top, SECTION_BG.replace("#", ""))
+        cell_top.text = ""
+        p1 = cell_top.paragraphs[0]
+        p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        add_run(p1, icon + " ", "CardIcon")
+        add_run(p1, title, "StrongText")
+
+        # Description row
+        cell_bot = table.rows[1].cells[i]
+        set_cell_shading(cell_bot, SECTION_BG.replace("#", ""))
+        cell_bot.text = ""
+        p2 = cell_bot.paragraphs[0]
+        p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        add_run(p2, desc, "NoteText")
+
+    return table
+
+def add_phase_block(doc, phase_num, title, duration, items, color=ACCENT_BAR):
+    """Add a visually distinct project phase block."""
+    table = doc.add_table(rows=1, cols=2)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    table.columns[0].width = Cm(2)
+    table.columns[1].width = Cm(14)
+
+    # Phase number circle (simulated with colored cell)
+    cell0 = table.rows[0].cells[0]
+    set_cell_shading(cell0, color)
+    cell0.text = ""
+    p0 = cell0.paragraphs[0]
+    p0.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    add_run(p0, f"\n{phase_num}\n", "PhaseNumber")
+
+    # Phase content
+    cell1 = table.rows[0].cells[1]
+    cell1.text = ""
+    add_run(cell1.paragraphs[0], title, "TitleText")
+    add_run(cell1.add_paragraph(), duration, "PhaseDuration")
+
+    for item in items:
+        add_run(cell1.add_paragraph(), "  \u25B8  " + item, "SmallText")
+
+    return table
+
+def add_paragraph_border(paragraph, edge, sz, space="1", color=ACCENT_BAR):
+    """Add a single coloured border line to one edge of a paragraph."""
+    paragraph._p.get_or_add_pPr().append(FRAGMENTS.paragraph_border(edge, sz, space, color))
+
+def hex_to_rgb(color_hex):
+    """Convert an "RRGGBB" string to an RGBColor."""
+    return RGBColor(int(color_hex[0:2], 16), int(color_hex[2:4], 16), int(color_hex[4:6], 16))
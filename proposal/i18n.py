@@ -0,0 +1,137 @@
+"""
+Localised variants of the proposal from one rendering.
+
+A translation memory (TM) is a JSON or YAML file:
+
+    {"locale": "pt-PT", "strings": {"Work Plan": "Plano de Trabalho", ...}}
+
+Keys are the text of individual runs as they appear in the English document
+(``write_tm_template`` lists every one). ``build_locales`` builds and renders
+the English proposal once, so the document model, fee arithmetic, Gantt grid
+and every table skeleton are computed a single time. Each locale, English
+included, is that rendering with run texts swapped through its TM, then laid
+out on its own (``build.layout_document``): translated text wraps and
+paginates differently, so TOC page numbers and fixed column widths are
+estimated per locale. The document language is switched and the package
+rewritten with every other part copied as stored. That per-locale work
+(translation, layout and rewrite) is pure Python, so the locales run in
+worker processes, each writing its own file. Strings missing from a TM stay
+in English and are reported.
+"""
+
+import io
+import json
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from .build import build_proposal, layout_document, resolve_content
+from .content_file import _format, _parse
+from .package import atomic_write, rewrite_zip
+
+_LANG = re.compile(rb'(<w:lang\b[^>]*\bw:val=")[^"]*(")')
+
+
+def _translatable(text):
+    """Amounts, page numbers, rules and icons are left alone."""
+    return any(c.isalpha() for c in text)
+
+def load_tm(path):
+    """Return ``(locale, strings)`` from the TM at ``path``."""
+    with open(path, "rb") as fh:
+        tm = _parse(fh.read(), _format(path), path)
+    if not isinstance(tm, dict) or not isinstance(tm.get("strings"), dict) or not tm.get("locale"):
+        raise ValueError(f"{path}: expected a mapping with 'locale' and 'strings'")
+    return tm["locale"], {k: v for k, v in tm["strings"].items() if v}
+
+def document_strings(doc):
+    """Distinct run texts of ``doc`` in document order (surrounding spaces stripped)."""
+    strings = {}
+    for t in doc.element.body.iter(qn("w:t")):
+        text = (t.text or "").strip()
+        if _translatable(text):
+            strings.setdefault(text)
+    return list(strings)
+
+def write_tm_template(path, locale, data=None, existing=None):
+    """Write a TM listing every string of the proposal; ``existing`` translations are kept."""
+    strings = existing or {}
+    tm = {"locale": locale,
+          "strings": {text: strings.get(text, "") for text in document_strings(build_proposal(data))}}
+    with open(path, "w", encoding="utf-8") as fh:
+        if _format(path) == "yaml":
+            import yaml
+            yaml.safe_dump(tm, fh, allow_unicode=True, sort_keys=False, width=100)
+        else:
+            json.dump(tm, fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
+    return len(tm["strings"])
+
+def localised_path(path, locale):
+    """``proposal.docx`` -> ``proposal.pt-PT.docx``."""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{locale}{ext}"
+
+def _translate(doc, strings):
+    """Swap the run texts of ``doc`` through ``strings`` in place; return the strings missing."""
+    missing = set()
+    for t in doc.element.body.iter(qn("w:t")):
+        text = t.text or ""
+        key = text.strip()
+        if not key:
+            continue
+        target = strings.get(key)
+        if target is None:
+            if _translatable(key):
+                missing.add(key)
+            continue
+        lead = text[:len(text) - len(text.lstrip())]
+        trail = text[len(text.rstrip()):]
+        t.text = lead + target + trail
+    return missing
+
+def _write_variant(base, data, out, tm=None):
+    """Translate the ``base`` package through ``tm`` (``(locale, strings)``; ``None``
+    for English), lay it out and write it; return ``(locale, path, missing_strings)``.
+    """
+    locale, strings = tm or ("en", None)
+    doc = Document(io.BytesIO(base))
+    missing = _translate(doc, strings) if tm else ()
+    layout_document(doc, data)
+    replace = {"word/document.xml": doc.part.blob}
+    if tm:
+        with zipfile.ZipFile(io.BytesIO(base)) as zf:
+            styles = zf.read("word/styles.xml")
+        replace["word/styles.xml"] = _LANG.sub(rb"\g<1>" + locale.encode() + rb"\g<2>", styles, count=1)
+    path = localised_path(out, locale) if tm else out
+    with atomic_write(path) as fh:
+        rewrite_zip(io.BytesIO(base), fh, replace)
+    return locale, path, sorted(missing)
+
+def build_locales(data=None, out=None, tms=(), deterministic=False, jobs=None):
+    """Build the English proposal to ``out`` plus one variant per TM in ``tms``.
+
+    ``out`` must be a file path: each variant is written next to it (see
+    ``localised_path``). ``tms`` are TM paths. The variants are written by up
+    to ``jobs`` worker processes (default: one per CPU); ``jobs=1`` keeps
+    everything in-process. Returns a list of ``(locale, path,
+    missing_strings)``, English first.
+    """
+    if not isinstance(out, (str, os.PathLike)) or out == "-":
+        raise ValueError("translated variants are written next to the output; give a file path, not stdout")
+    data = resolve_content(data)
+    variants = [None, *(load_tm(source) for source in tms)]
+    buf = io.BytesIO()
+    build_proposal(data, out=buf, deterministic=deterministic, layout=False)
+    base = buf.getvalue()
+
+    jobs = min(jobs or os.cpu_count() or 1, len(variants))
+    if jobs == 1:
+        return [_write_variant(base, data, out, tm) for tm in variants]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_write_variant, repeat(base), repeat(data), repeat(out), variants))
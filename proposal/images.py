@@ -0,0 +1,136 @@
+"""
+Image pipeline for portfolio screenshots.
+
+Each ``ir.Image`` is downscaled to its printed width at the node's DPI and
+recompressed (optimised PNG or JPEG, whichever is smaller) before it is
+embedded, so a full-resolution screenshot costs what its printed size needs.
+Results are cached in memory and, with a cache directory, on disk by the
+SHA-256 of the source file plus the target pixel width and DPI; a rerun with
+unchanged screenshots does no image work at all. ``prepare_images`` processes
+every uncached image of a build in a process pool before rendering starts.
+
+Identical results are stored once: python-docx reuses an existing media part
+for an image whose bytes it has already embedded, and equal sources give
+equal bytes here.
+
+Needs Pillow (``pip install pillow``) when a proposal has screenshots.
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ir
+from .package import atomic_write
+
+JPEG_QUALITY = 85
+
+# path -> (mtime_ns, size, sha256)
+_HASHES = {}
+# (sha256, width_px, dpi) -> prepared image bytes
+_PREPARED = {}
+
+
+def source_hash(path):
+    """SHA-256 of an image file, re-read only when its mtime or size changes."""
+    st = os.stat(path)
+    cached = _HASHES.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, "rb") as fh:
+        sha = hashlib.sha256(fh.read()).hexdigest()
+    _HASHES[path] = (st.st_mtime_ns, st.st_size, sha)
+    return sha
+
+def _key(node):
+    return source_hash(node.path), round(node.width * node.dpi), node.dpi
+
+def _disk_path(cache_dir, key):
+    sha, px, dpi = key
+    return os.path.join(cache_dir, f"image-{sha}-{px}w-{dpi}dpi.bin")
+
+def downscale(raw, px, dpi):
+    """Return ``raw`` resized to at most ``px`` pixels wide and recompressed."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("embedding screenshots needs Pillow (pip install pillow)")
+    with Image.open(io.BytesIO(raw)) as source:
+        image = source
+        if image.width > px:
+            image = image.resize((px, max(1, round(image.height * px / image.width))), Image.LANCZOS)
+        png = io.BytesIO()
+        image.save(png, "PNG", optimize=True, dpi=(dpi, dpi))
+        candidates = [png.getvalue()]
+        if image.mode not in ("RGBA", "LA") and "transparency" not in image.info:
+            # Flat UI screenshots favour PNG, photographic ones JPEG: keep the smaller
+            jpeg = io.BytesIO()
+            image.convert("RGB").save(jpeg, "JPEG", quality=JPEG_QUALITY, optimize=True, dpi=(dpi, dpi))
+            candidates.append(jpeg.getvalue())
+        if source.format in ("PNG", "JPEG"):
+            candidates.append(raw)  # a well-compressed source can beat the re-encode
+    return min(candidates, key=len)
+
+def _prepare(args):
+    """Worker: downscale one source and store it in the disk cache; return its bytes."""
+    path, key, cache_dir = args
+    with open(path, "rb") as fh:
+        data = downscale(fh.read(), key[1], key[2])
+    if cache_dir:
+        with atomic_write(_disk_path(cache_dir, key)) as fh:
+            fh.write(data)
+    return data
+
+def _cached(key, cache_dir):
+    data = _PREPARED.get(key)
+    if data is None and cache_dir:
+        try:
+            with open(_disk_path(cache_dir, key), "rb") as fh:
+                data = _PREPARED[key] = fh.read()
+        except FileNotFoundError:
+            pass
+    return data
+
+def image_nodes(sections):
+    """Every ``ir.Image`` in ``sections``."""
+    return [node for section in sections for node in section.children if isinstance(node, ir.Image)]
+
+def prepare_images(nodes, cache_dir=None, jobs=None):
+    """Make sure every image in ``nodes`` is prepared; uncached ones go to a process pool.
+
+    Returns ``(cached, processed)`` counts of distinct images.
+    """
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    todo = {}
+    for node in nodes:
+        key = _key(node)
+        if key not in todo and _cached(key, cache_dir) is None:
+            todo[key] = node.path
+    tasks = [(path, key, cache_dir) for key, path in todo.items()]
+    jobs = jobs or os.cpu_count() or 1
+    if len(tasks) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            results = list(pool.map(_prepare, tasks))
+    else:
+        results = [_prepare(task) for task in tasks]
+    for (_, key, _), data in zip(tasks, results):
+        _PREPARED[key] = data
+    distinct = len({_key(node) for node in nodes})
+    return distinct - len(tasks), len(tasks)
+
+def prepared_image(node):
+    """Bytes to embed for ``node``, preparing it in-process if ``prepare_images`` has not."""
+    key = _key(node)
+    data = _PREPARED.get(key)
+    if data is None:
+        data = _PREPARED[key] = _prepare((node.path, key, None))
+    return data
+
+def content_images(data):
+    """Image paths referenced by a resolved content mapping (for cache keys)."""
+    paths = [path for _, path in data.get("screenshots") or ()]
+    for ref in data.get("references") or ():
+        paths += [path for _, path in ref.get("screenshots", ())]
+    return paths
@@ -0,0 +1,150 @@
+"""
+On-disk cache of rendered section fragments for incremental rebuilds.
+
+A section's key hashes its document model (``repr`` of the ``ir.Section``,
+which captures every content value it uses) together with the package source
+and python-docx version, so editing one fee line only changes Section E's key.
+On a hit the cached ``w:body`` children are parsed and spliced into the
+document instead of re-running the helpers. Fragments are self-contained:
+sections use no relationships, and ad-hoc character styles are re-created
+from ``Section.styles`` on every build. Sections with images are the
+exception: their media parts live outside the body, so they are always
+rendered (the downscaled images themselves are cached by ``proposal.images``).
+
+The layout estimate of a build (TOC pages and table widths, see
+``proposal.layout``) is stored beside the fragments as ``layout-<key>.json``,
+keyed by every section key, so a build made entirely of cached sections
+replays it instead of measuring the document again.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import os
+from importlib import metadata
+
+from docx.oxml import parse_xml
+from lxml import etree
+
+from .images import image_nodes
+from .package import atomic_write
+from .render_docx import render_section
+from .styles import ensure_character_style
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """Hash of the package source and python-docx version (part of every key)."""
+    digest = hashlib.sha256(metadata.version("python-docx").encode())
+    package = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(package)):
+        if name.endswith(".py"):
+            with open(os.path.join(package, name), "rb") as fh:
+                digest.update(name.encode() + b"\0" + fh.read())
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """Rendered section fragments stored as ``<key>.xml`` files in ``directory``."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.used = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, section):
+        return hashlib.sha256(f"{code_version()}\0{section!r}".encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".xml")
+
+    def load(self, key):
+        """Return the cached ``w:body`` fragment for ``key``, or ``None``."""
+        try:
+            with open(self._path(key), "rb") as fh:
+                return parse_xml(fh.read())
+        except FileNotFoundError:
+            return None
+
+    def store(self, key, body, children):
+        """Serialise ``children`` of ``body`` under one ``w:body`` wrapper, atomically."""
+        wrapper = etree.Element(body.tag, nsmap=body.nsmap)
+        wrapper.extend(copy.deepcopy(child) for child in children)
+        with atomic_write(self._path(key)) as fh:
+            fh.write(etree.tostring(wrapper))
+
+    def render(self, doc, section, profiler=None):
+        """Append ``section`` to ``doc``, from the cache when its key is known."""
+        if image_nodes([section]):
+            render_section(doc, section, profiler)
+            return
+        body = doc.element.body
+        key = self.key(section)
+        self.used.add(key)
+        fragment = self.load(key)
+        if fragment is not None:
+            self.hits += 1
+            for style_id, (size, color, bold) in section.styles.items():
+                ensure_character_style(doc, style_id, size, color, bold)
+            sect_pr = body[-1]
+            for child in list(fragment):
+                sect_pr.addprevious(child)
+            return
+        self.misses += 1
+        before = len(body)
+        render_section(doc, section, profiler)
+        # Everything is inserted ahead of the trailing w:sectPr
+        self.store(key, body, body[before - 1:len(body) - 1])
+
+    def layout_key(self, sections):
+        """Key of the layout of ``sections``; ``None`` when a section has images (their files may change)."""
+        if image_nodes(sections):
+            return None
+        keys = "\0".join(self.key(section) for section in sections)
+        return "layout-" + hashlib.sha256(keys.encode()).hexdigest()
+
+    def load_layout(self, sections):
+        """Return the layout record stored for ``sections``, or ``None``."""
+        key = self.layout_key(sections)
+        if key is None:
+            return None
+        self.used.add(key)
+        try:
+            with open(os.path.join(self.directory, key + ".json"), "rb") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def store_layout(self, sections, record):
+        key = self.layout_key(sections)
+        if key is not None:
+            self.used.add(key)
+            with atomic_write(os.path.join(self.directory, key + ".json")) as fh:
+                fh.write(json.dumps(record).encode("utf-8"))
+
+    def _entries(self):
+        """``(stem, file name)`` of every fragment and layout record in the directory."""
+        for name in os.listdir(self.directory):
+            stem, ext = os.path.splitext(name)
+            if ext == ".xml" or ext == ".json" and stem.startswith("layout-"):
+                yield stem, name
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def prune(self):
+        """Delete entries not used since the last ``prune``; return how many went."""
+        removed = 0
+        for stem, name in self._entries():
+            if stem not in self.used:
+                os.unlink(os.path.join(self.directory, name))
+                removed += 1
+        self.used = set()
+        return removed
+
+    def clear(self):
+        for _, name in self._entries():
+            os.unlink(os.path.join(self.directory, name))
@@ -0,0 +1,187 @@
+"""
+Intermediate document model.
+
+Section builders in ``proposal.build`` turn the content mapping into a list of
+``Section`` nodes once; ``proposal.render_docx`` and ``proposal.render_markdown``
+then walk the same tree, so every output format comes from one pass over the
+content. Nodes are plain ``__slots__`` records with no behaviour of their own.
+
+Run styles are character style ids from ``proposal.styles``; a section that
+needs an ad-hoc style (e.g. a content-supplied accent colour) lists it in
+``Section.styles`` as ``{style_id: (size, color_hex, bold)}``.
+"""
+
+
+class Node:
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class Section(Node):
+    """A top-level proposal section; ends with a page break unless ``page_break`` is false."""
+    __slots__ = ("name", "children", "page_break", "styles")
+
+    def __init__(self, name, children, page_break=True, styles=None):
+        self.name = name
+        self.children = children
+        self.page_break = page_break
+        self.styles = styles or {}
+
+
+class Heading(Node):
+    __slots__ = ("text", "level")
+
+    def __init__(self, text, level=1):
+        self.text = text
+        self.level = level
+
+
+class Body(Node):
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Para(Node):
+    """A paragraph of ``(text, style)`` runs; ``style`` is an optional paragraph style id."""
+    __slots__ = ("runs", "align", "border", "style")
+
+    def __init__(self, runs=(), align=None, border=None, style=None):
+        self.runs = tuple(runs)
+        self.align = align
+        self.border = border  # (edge, sz) or (edge, sz, space)
+        self.style = style
+
+
+class Spacer(Node):
+    """Empty paragraphs used for vertical spacing (DOCX only)."""
+    __slots__ = ("count",)
+
+    def __init__(self, count=1):
+        self.count = count
+
+
+class PageBreak(Node):
+    """An explicit page break inside a section."""
+    __slots__ = ()
+
+
+class Bullet(Node):
+    __slots__ = ("text", "prefix")
+
+    def __init__(self, text, prefix=None):
+        self.text = text
+        self.prefix = prefix
+
+
+class InfoBox(Node):
+    __slots__ = ("title", "content", "fill")
+
+    def __init__(self, title, content, fill):
+        self.title = title
+        self.content = content
+        self.fill = fill
+
+
+class Box(Node):
+    """A bordered, shaded cell of ``Para`` nodes; on its own it is a one-cell table."""
+    __slots__ = ("paragraphs", "fill", "borders")
+
+    def __init__(self, paragraphs, fill=None, borders=None):
+        self.paragraphs = paragraphs
+        self.fill = fill
+        self.borders = borders  # set_cell_border() keyword mapping
+
+
+class Grid(Node):
+    """``Box`` cells laid out row by row in ``cols`` columns."""
+    __slots__ = ("cells", "cols")
+
+    def __init__(self, cells, cols):
+        self.cells = cells
+        self.cols = cols
+
+
+class CardRow(Node):
+    __slots__ = ("cards",)
+
+    def __init__(self, cards):
+        self.cards = cards  # [(icon, title, description)]
+
+
+class PhaseBlock(Node):
+    __slots__ = ("number", "title", "duration", "items", "color")
+
+    def __init__(self, number, title, duration, items, color):
+        self.number = number
+        self.title = title
+        self.duration = duration
+        self.items = items
+        self.color = color
+
+
+class Table(Node):
+    """A data table; the fields mirror ``proposal.tables.build_table``.
+
+    ``row_styles`` is either one ``(style, fill)`` pair for every row or a
+    list with one pair per row.
+    """
+    __slots__ = ("rows", "header", "style", "banded", "total_row", "row_styles",
+                 "col_align", "header_align", "col_widths", "header_style", "autofit")
+
+    def __init__(self, rows, header=None, *, style="ProposalTable", banded=False,
+                 total_row=False, row_styles=(None, None), col_align=None,
+                 header_align=None, col_widths=None, header_style="TableHeader",
+                 autofit=False):
+        self.rows = rows
+        self.header = header
+        self.style = style
+        self.banded = banded
+        self.total_row = total_row
+        self.row_styles = row_styles
+        self.col_align = col_align
+        self.header_align = header_align
+        self.col_widths = col_widths
+        self.header_style = header_style
+        self.autofit = autofit
+
+
+class BarChart(Node):
+    __slots__ = ("bars",)
+
+    def __init__(self, bars):
+        self.bars = bars  # [(label, percentage, color)]
+
+
+class Image(Node):
+    """A picture ``width`` inches wide, downscaled to ``dpi`` by ``proposal.images``."""
+    __slots__ = ("path", "width", "caption", "dpi")
+
+    def __init__(self, path, width, caption=None, dpi=150):
+        self.path = path
+        self.width = width
+        self.caption = caption
+        self.dpi = dpi
+
+
+class Gantt(Node):
+    __slots__ = ("phases", "granularity", "start")
+
+    def __init__(self, phases, granularity="week", start=None):
+        self.phases = phases  # [(name, start, end, color)]
+        self.granularity = granularity
+        self.start = start
+
+
+def styled_table(header, rows, col_widths=None):
+    """The ``add_styled_table`` look: even banding and small text."""
+    return Table(rows, header, style="ProposalTableEven", banded=True,
+                 row_styles=("SmallText", None), col_widths=col_widths, autofit=True)
@@ -0,0 +1,201 @@
+"""
+Streaming Markdown to DOCX converter.
+
+``iter_nodes`` reads Markdown one line at a time and yields ``proposal.ir``
+nodes as soon as each block ends; ``convert_markdown`` renders every node into
+the document straight away and drops it. Only the block being read is held
+(one paragraph, list item, quote or table), so memory for the Markdown side
+stays bounded however long the source is. No AST is built.
+
+Mapping onto the proposal look:
+
+- ``#``: centred cover title. ``##``: section heading, starting a new page.
+  ``###``: level-2 heading. ``####`` and deeper: level-3 heading.
+- ``-``/``*``/``1.`` list items become bullets. A leading ``**bold**`` phrase
+  becomes the bullet's bold prefix.
+- Pipe tables become styled tables.
+- ``>`` block quotes become info boxes, titled by their leading ``**bold**``
+  phrase.
+- A line holding only ``![caption](path)`` becomes a full-width image
+  (relative paths resolve against the Markdown file's directory).
+- Other text becomes body paragraphs. Line breaks inside a paragraph are
+  kept (address blocks). Inline ``**bold**`` is kept.
+- ``---`` rules and HTML comments are dropped.
+"""
+
+import os
+import re
+
+from . import ir
+from .helpers import SECTION_BG
+from .layout import fix_table_widths
+from .render_docx import RENDERERS
+from .template import new_document
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_ITEM = re.compile(r"^\s*(?:[-*+]|(\d+)[.)])\s+(.*)$")
+_RULE = re.compile(r"^\s*(?:-{3,}|\*{3,}|_{3,})\s*$")
+_TABLE_SEP = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_LEAD_BOLD = re.compile(r"^\*\*(.+?)\*\*(.*)$", re.S)
+_IMAGE = re.compile(r"^!\[(.*?)\]\(<?(.+?)>?\)$")
+
+IMAGE_WIDTH = 6.0
+
+
+def _runs(text, style=None):
+    """Split ``**bold**`` spans into ``(text, style)`` runs."""
+    runs = []
+    for i, part in enumerate(text.split("**")):
+        if part:
+            runs.append((part, "BoldText" if i % 2 else style))
+    return runs
+
+def _cells(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    cells = re.split(r"(?<!\\)\|", line)
+    return [c.strip().replace("\\|", "|").replace("**", "") for c in cells]
+
+def _paragraph(lines):
+    text = "\n".join(line.rstrip().rstrip("\\") for line in lines)
+    if "**" not in text:
+        return ir.Body(text)
+    return ir.Para(_runs(text), style="ProposalBody")
+
+def _bullet(number, text):
+    lead = _LEAD_BOLD.match(text)
+    prefix = f"{number}. " if number else None
+    if lead:
+        prefix = (prefix or "") + lead.group(1)
+        text = lead.group(2)
+    return ir.Bullet(text.replace("**", ""), prefix)
+
+def _quote(lines):
+    text = "\n".join(lines).strip()
+    lead = _LEAD_BOLD.match(text)
+    if lead:
+        return ir.InfoBox(lead.group(1).strip(), lead.group(2).strip().replace("**", ""), SECTION_BG)
+    return ir.InfoBox("", text.replace("**", ""), SECTION_BG)
+
+def iter_nodes(lines, base_dir=""):
+    """Yield ``ir`` nodes for an iterable of Markdown lines, block by block.
+
+    Relative image paths are resolved against ``base_dir``.
+    """
+    para, quote, item = [], [], None
+    header, rows = None, []
+    started = False  # anything emitted yet (page breaks go between sections)
+    in_comment = False
+
+    def flush():
+        nonlocal para, quote, item, header, rows
+        if para:
+            yield _paragraph(para)
+        if quote:
+            yield _quote(quote)
+        if item:
+            yield _bullet(*item)
+        if header is not None:
+            yield ir.styled_table(header, rows)
+        para, quote, item, header, rows = [], [], None, None, []
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        stripped = line.strip()
+
+        if in_comment or stripped.startswith("<!--"):
+            in_comment = "-->" not in stripped
+            continue
+
+        # Tables: a header row followed by a separator row, then data rows
+        if stripped.startswith("|"):
+            if header is not None:
+                if not _TABLE_SEP.match(stripped):
+                    rows.append(_cells(stripped))
+                continue
+            if para and para[-1].lstrip().startswith("|") and _TABLE_SEP.match(stripped):
+                head = para.pop()
+                yield from flush()
+                header = _cells(head)
+                continue
+        elif header is not None:
+            yield from flush()
+
+        if not stripped:
+            yield from flush()
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            yield from flush()
+            level, text = len(heading.group(1)), heading.group(2)
+            if level == 1:
+                yield ir.Para([(text, "CoverTitle")], align="center")
+            else:
+                if level == 2 and started:
+                    yield ir.PageBreak()
+                yield ir.Heading(text, min(level - 1, 3))
+            started = True
+            continue
+
+        if _RULE.match(line):
+            yield from flush()
+            continue
+
+        image = _IMAGE.match(stripped)
+        if image:
+            yield from flush()
+            yield ir.Image(os.path.join(base_dir, image.group(2)), IMAGE_WIDTH, image.group(1) or None)
+            started = True
+            continue
+
+        if stripped.startswith(">"):
+            if not quote:
+                yield from flush()
+            quote.append(stripped[1:].lstrip())
+            started = True
+            continue
+
+        match = _ITEM.match(line)
+        if match:
+            yield from flush()
+            item = (match.group(1), match.group(2))
+            started = True
+            continue
+        if item and line[:1].isspace():
+            # Continuation line of a list item
+            item = (item[0], item[1] + " " + stripped)
+            continue
+
+        if quote or item:
+            yield from flush()
+        para.append(line)
+        started = True
+
+    yield from flush()
+
+def convert_markdown(source, out=None, doc=None):
+    """Convert a Markdown file (path or text stream) into a proposal ``Document``.
+
+    Nodes are rendered as they are parsed, then table column widths are
+    fixed (see ``proposal.layout``). ``out`` is an optional path or binary
+    stream to save to; the document is returned either way.
+    """
+    doc = doc if doc is not None else new_document()
+    if hasattr(source, "read"):
+        lines, base_dir = source, ""
+    else:
+        lines, base_dir = open(source, encoding="utf-8"), os.path.dirname(source)
+    try:
+        for node in iter_nodes(lines, base_dir):
+            RENDERERS[type(node)](doc, node)
+    finally:
+        if lines is not source:
+            lines.close()
+    fix_table_widths(doc, doc.element.body)
+    if out is not None:
+        doc.save(out)
+    return doc
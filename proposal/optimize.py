@@ -0,0 +1,299 @@
+"""
+Post-build XML optimiser for .docx packages.
+
+    python -m proposal.optimize proposal.docx [-o smaller.docx]
+
+Three passes over the document, header, footer and note parts:
+
+* duplicate ``w:tcPr`` children are collapsed: ``set_cell_shading`` twice on a
+  cell leaves two ``w:shd`` and ``set_cell_border`` always appends another
+  ``w:tcBorders``. The last value wins, borders are merged edge by edge, and
+  the result keeps the position of the first occurrence;
+* direct run and paragraph properties equal to what the paragraph and
+  character styles (and document defaults) already give are removed. Toggle
+  properties (``w:b``, ``w:i`` ...) are only stripped when a single level of the
+  hierarchy sets them, since Word flips them when several do; inside tables,
+  where table styles may interfere, only values set by the paragraph or
+  character style count;
+* adjacent runs with identical properties and plain content (text, tabs,
+  breaks) are merged, and runs without content dropped.
+
+``optimize_document`` works on a built ``Document`` before it is saved (the
+``optimize`` option of ``build_proposal``); ``optimize_docx`` rewrites an
+existing file, replacing only the parts that changed.
+"""
+
+import argparse
+import os
+import re
+import sys
+import zipfile
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+from .package import atomic_write, rewrite_zip
+
+STYLES = "word/styles.xml"
+
+_STORY_PART = re.compile(r"word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$")
+
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+P, R, T, RPR, PPR, TBL = qn("w:p"), qn("w:r"), qn("w:t"), qn("w:rPr"), qn("w:pPr"), qn("w:tbl")
+VAL, PSTYLE, RSTYLE, NUMPR = qn("w:val"), qn("w:pStyle"), qn("w:rStyle"), qn("w:numPr")
+_CONTAINERS = (qn("w:hyperlink"), qn("w:smartTag"), qn("w:fldSimple"))
+
+# Run content that can be moved between runs without changing its meaning
+_PLAIN = {qn(f"w:{tag}") for tag in ("t", "tab", "br", "cr", "noBreakHyphen", "softHyphen")}
+
+# Property children holding other properties or bookkeeping, never stripped
+_NESTED = {qn(f"w:{tag}") for tag in ("rStyle", "pStyle", "rPr", "sectPr", "rPrChange", "pPrChange", "ins", "del")}
+
+_TOGGLES = {qn(f"w:{tag}") for tag in ("b", "bCs", "i", "iCs", "caps", "smallCaps", "strike", "dstrike",
+                                        "outline", "shadow", "emboss", "imprint", "vanish")}
+
+# w:tcPr children whose duplicates merge child by child, in schema order
+_EDGES = {qn(f"w:{tag}"): i for i, tag in enumerate(
+    ("top", "start", "left", "bottom", "end", "right", "insideH", "insideV", "tl2br", "tr2bl"))}
+_MERGED = {qn("w:tcBorders"), qn("w:tcMar")}
+
+
+def _key(el):
+    """Hashable structural identity of an element (tag, attributes, children)."""
+    return el.tag, tuple(sorted(el.attrib.items())), tuple(_key(child) for child in el)
+
+def _props(pr):
+    """``{tag: key}`` of the plain property children of a ``w:rPr`` / ``w:pPr``."""
+    if pr is None:
+        return {}
+    return {child.tag: _key(child) for child in pr if child.tag not in _NESTED}
+
+
+class StyleIndex:
+    """Run and paragraph properties each style resolves to through ``w:basedOn``."""
+
+    def __init__(self, root=None):
+        self.styles, self.defaults = {}, {}
+        self.doc_rpr = self.doc_ppr = {}
+        self._cache = {}
+        if root is None:
+            return
+        for style in root.iterchildren(qn("w:style")):
+            style_id = style.get(qn("w:styleId"))
+            self.styles[style_id] = style
+            if style.get(qn("w:default")) in ("1", "true", "on"):
+                self.defaults[style.get(qn("w:type"))] = style_id
+        defaults = root.find(qn("w:docDefaults"))
+        if defaults is not None:
+            self.doc_rpr = _props(defaults.find(f"{qn('w:rPrDefault')}/{RPR}"))
+            self.doc_ppr = _props(defaults.find(f"{qn('w:pPrDefault')}/{PPR}"))
+
+    def resolve(self, style_id, tag):
+        """Properties under ``tag`` (``w:rPr`` or ``w:pPr``) of ``style_id``, nearest style first."""
+        cached = self._cache.get((style_id, tag))
+        if cached is not None:
+            return cached
+        props, seen, current = {}, set(), style_id
+        while current in self.styles and current not in seen:
+            seen.add(current)
+            style = self.styles[current]
+            for prop, key in _props(style.find(tag)).items():
+                props.setdefault(prop, key)
+            based_on = style.find(qn("w:basedOn"))
+            current = based_on.get(VAL) if based_on is not None else None
+        self._cache[(style_id, tag)] = props
+        return props
+
+    def paragraph_style(self, p):
+        ppr = p.find(PPR)
+        style = ppr.find(PSTYLE) if ppr is not None else None
+        return style.get(VAL) if style is not None else self.defaults.get("paragraph")
+
+
+class Optimizer:
+    """One pass over story parts; counts what it changed."""
+
+    def __init__(self, styles=None):
+        self.styles = styles or StyleIndex()
+        self.counts = {"duplicates": 0, "properties": 0, "runs_merged": 0, "runs_dropped": 0}
+
+    def optimize(self, root):
+        for tc_pr in root.iter(qn("w:tcPr")):
+            self._collapse(tc_pr)
+        for p in root.iter(P):
+            self._paragraph(p)
+        return root
+
+    # ── Duplicate tcPr children ──
+
+    def _collapse(self, pr):
+        first = {}
+        for child in list(pr):
+            kept = first.setdefault(child.tag, child)
+            if kept is child:
+                continue
+            self.counts["duplicates"] += 1
+            if child.tag in _MERGED:
+                edges = {edge.tag: edge for edge in kept}
+                edges.update((edge.tag, edge) for edge in child)
+                kept[:] = sorted(edges.values(), key=lambda edge: _EDGES.get(edge.tag, len(_EDGES)))
+                pr.remove(child)
+            else:
+                kept.addnext(child)
+                pr.remove(kept)
+                first[child.tag] = child
+
+    # ── Redundant properties ──
+
+    def _paragraph(self, p):
+        in_table = next(p.iterancestors(TBL), None) is not None
+        style_id = self.styles.paragraph_style(p)
+        para_rpr = self.styles.resolve(style_id, RPR)
+        ppr = p.find(PPR)
+        if ppr is not None:
+            inherited = self.styles.resolve(style_id, PPR)
+            numbered = ppr.find(NUMPR) is not None or NUMPR in inherited
+            skip = {qn("w:ind"), qn("w:tabs")} if numbered else set()  # numbering may override the style
+            self._strip(ppr, [inherited], {} if in_table else self.styles.doc_ppr, skip, toggles=False)
+            if not len(ppr) and not ppr.attrib:
+                p.remove(ppr)
+        for run in p.iter(R):
+            rpr = run.find(RPR)
+            if rpr is None or next(run.iterancestors(P)) is not p:  # text box paragraphs get their own pass
+                continue
+            char = rpr.find(RSTYLE)
+            char_id = char.get(VAL) if char is not None else self.styles.defaults.get("character")
+            levels = [self.styles.resolve(char_id, RPR), para_rpr]
+            self._strip(rpr, levels, {} if in_table else self.styles.doc_rpr, set(), toggles=not in_table)
+            if not len(rpr) and not rpr.attrib:
+                run.remove(rpr)
+        self._merge_runs(p)
+
+    def _strip(self, pr, levels, defaults, skip, toggles):
+        """Remove children of ``pr`` equal to the inherited value; ``levels`` nearest first."""
+        for child in list(pr):
+            tag = child.tag
+            if tag in _NESTED or tag in skip:
+                continue
+            if tag in _TOGGLES:
+                if not toggles:
+                    continue
+                setters = [level[tag] for level in levels if tag in level]
+                if tag in defaults:
+                    setters.append(defaults[tag])
+                inherited = setters[0] if len(setters) == 1 else None
+            else:
+                inherited = next((level[tag] for level in levels if tag in level), defaults.get(tag))
+            if inherited is not None and inherited == _key(child):
+                pr.remove(child)
+                self.counts["properties"] += 1
+
+    # ── Run coalescing ──
+
+    def _merge_runs(self, p):
+        for parent in [p, *p.iter(*_CONTAINERS)]:
+            previous = previous_key = None
+            for run in list(parent.iterchildren(R)):
+                content = [child for child in run if child.tag != RPR]
+                if not content:
+                    parent.remove(run)
+                    self.counts["runs_dropped"] += 1
+                    continue
+                plain = all(child.tag in _PLAIN for child in content)
+                rpr = run.find(RPR)
+                key = (tuple(sorted(run.attrib.items())), _key(rpr) if rpr is not None else None) if plain else None
+                if key is not None and key == previous_key and run.getprevious() is previous:
+                    previous.extend(content)
+                    parent.remove(run)
+                    self.counts["runs_merged"] += 1
+                    continue
+                if previous is not None and previous_key is not None:
+                    _join_text(previous)
+                previous, previous_key = run, key
+            if previous is not None and previous_key is not None:
+                _join_text(previous)
+
+
+def _join_text(run):
+    """Concatenate adjacent ``w:t`` children of ``run``."""
+    last = None
+    for child in list(run):
+        if child.tag == T and last is not None and last.tag == T:
+            last.text = (last.text or "") + (child.text or "")
+            run.remove(child)
+            continue
+        last = child
+    for t in run.iterchildren(T):
+        text = t.text or ""
+        if text != text.strip():
+            t.set(_XML_SPACE, "preserve")
+
+def _serialise(root):
+    return etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+
+def optimize_document(doc):
+    """Optimise the story parts of an unsaved ``Document`` in place.
+
+    Returns a report mapping: ``parts`` maps each part name to its
+    ``(before, after)`` serialised size, plus the counts of each change.
+    """
+    optimizer = Optimizer(StyleIndex(doc.styles.element))
+    parts = {}
+    for part in doc.part.package.iter_parts():
+        name = str(part.partname).lstrip("/")
+        if not _STORY_PART.match(name):
+            continue
+        before = len(part.blob)
+        optimizer.optimize(part.element)
+        parts[name] = (before, len(part.blob))
+    return {"parts": parts, **optimizer.counts}
+
+def optimize_docx(path, out=None):
+    """Optimise the .docx at ``path``, writing to ``out`` or atomically back to ``path``.
+
+    Only parts whose XML changed are replaced; every other member is copied as
+    stored. Returns the report of ``optimize_document`` plus the package size
+    before and after (``size``).
+    """
+    with zipfile.ZipFile(path) as zf:
+        names = [name for name in zf.namelist() if _STORY_PART.match(name)]
+        styles = etree.fromstring(zf.read(STYLES)) if STYLES in zf.namelist() else None
+        sources = {name: zf.read(name) for name in names}
+    optimizer = Optimizer(StyleIndex(styles))
+    parts, replace = {}, {}
+    for name, xml in sources.items():
+        optimized = _serialise(optimizer.optimize(etree.fromstring(xml)))
+        parts[name] = (len(xml), len(optimized))
+        if optimized != xml:
+            replace[name] = optimized
+
+    before = os.path.getsize(path)
+    target = out or path
+    with atomic_write(target) as fh:
+        rewrite_zip(path, fh, replace)
+    return {"parts": parts, **optimizer.counts, "size": (before, os.path.getsize(target))}
+
+def format_report(report):
+    lines = []
+    for name, (before, after) in report["parts"].items():
+        lines.append(f"  {name:<24} {before:>10,} -> {after:>10,} bytes ({before - after:,} saved)")
+    lines.append(f"{report['runs_merged']} runs merged, {report['runs_dropped']} empty runs dropped, "
+                 f"{report['properties']} redundant properties and "
+                 f"{report['duplicates']} duplicate cell properties removed")
+    if "size" in report:
+        before, after = report["size"]
+        lines.append(f"Package: {before:,} -> {after:,} bytes ({before - after:,} saved)")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shrink the XML of an existing .docx")
+    parser.add_argument("docx")
+    parser.add_argument("-o", "--output", help="write here instead of replacing the input")
+    args = parser.parse_args(argv)
+    print(format_report(optimize_docx(args.docx, args.output)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
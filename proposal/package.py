@@ -0,0 +1,123 @@
+"""
+Zip- and file-level helpers for .docx packages.
+
+``rewrite_zip`` copies a package member by member without decompressing
+anything it does not have to: unchanged members keep their stored bytes,
+replaced members are deflated once, and timestamps can be pinned by rewriting
+only the 30-byte local headers. It writes strictly sequentially, so ``out``
+may be a pipe or socket stream.
+
+``atomic_write`` is how every output and cache file is written: into a
+temporary file beside the target, moved over it only once complete.
+"""
+
+import contextlib
+import os
+import stat
+import struct
+import zipfile
+import zlib
+
+_LOCAL = struct.Struct("<4s5H3L2H")
+_CENTRAL = struct.Struct("<4s6H3L5H2L")
+_END = struct.Struct("<4s4H2LH")
+_DESCRIPTOR = b"PK\x07\x08"
+
+
+@contextlib.contextmanager
+def atomic_write(path):
+    """Open a binary stream whose content replaces ``path`` when the block exits cleanly.
+
+    The file keeps the permission bits of the one it replaces; a new file gets
+    the usual ``0o666`` less the umask. On error the target is left untouched.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+    # Created like open() would, so the kernel applies the umask
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            yield fh
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _dos_time(date_time):
+    y, mo, d, h, mi, s = date_time
+    return h << 11 | mi << 5 | s // 2, (y - 1980) << 9 | mo << 5 | d
+
+def _raw_member(fp, info, stamp=None):
+    """Return the local header, compressed data and data descriptor of ``info`` as stored.
+
+    ``stamp`` is an optional ``(dos_time, dos_date)`` written into the header.
+    """
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL.size)
+    fields = _LOCAL.unpack(header)
+    if stamp is not None:
+        header = _LOCAL.pack(*fields[:4], *stamp, *fields[6:])
+    rest = fp.read(fields[9] + fields[10] + info.compress_size)
+    tail = b""
+    if info.flag_bits & 0x08:
+        tail = fp.read(4)
+        tail += fp.read(12 if tail == _DESCRIPTOR else 8)
+    return header + rest + tail
+
+def _deflated_member(info, data, stamp):
+    """Return ``(local_record, central_fields)`` for ``data`` stored under ``info``'s name."""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    packed = compressor.compress(data) + compressor.flush()
+    name = info.filename.encode("utf-8")
+    flags = 0x800 if not info.filename.isascii() else 0
+    crc = zlib.crc32(data)
+    time, date = stamp
+    header = _LOCAL.pack(b"PK\x03\x04", 20, flags, zipfile.ZIP_DEFLATED, time, date,
+                         crc, len(packed), len(data), len(name), 0)
+    return header + name + packed, (20, flags, zipfile.ZIP_DEFLATED, time, date,
+                                    crc, len(packed), len(data), b"")
+
+def _central(info, fields, offset):
+    version, flags, method, time, date, crc, csize, size, extra = fields
+    name = info.filename.encode("utf-8" if flags & 0x800 else "cp437")
+    made_by = info.create_system << 8 | info.create_version
+    return _CENTRAL.pack(b"PK\x01\x02", made_by, version, flags, method, time, date, crc,
+                         csize, size, len(name), len(extra), len(info.comment), 0,
+                         info.internal_attr, info.external_attr, offset) + name + extra + info.comment
+
+def rewrite_zip(source, out, replace=None, date_time=None):
+    """Copy the package ``source`` to the binary stream ``out``, replacing members.
+
+    ``replace`` maps member names to new uncompressed bytes. Every other member
+    is copied as stored, without decompressing it. ``date_time`` (a
+    ``ZipInfo.date_time`` tuple) pins every member's timestamp. Returns the
+    number of members copied unchanged.
+    """
+    replace = replace or {}
+    pinned = _dos_time(date_time) if date_time else None
+    copied = offset = 0
+    central = []
+    with zipfile.ZipFile(source) as zin:
+        for info in zin.infolist():
+            if offset > 0xFFFFFFFF:
+                raise ValueError("package too large to rewrite (zip64 is not supported)")
+            stamp = pinned or _dos_time(info.date_time)
+            if info.filename in replace:
+                record, fields = _deflated_member(info, replace[info.filename], stamp)
+            else:
+                record = _raw_member(zin.fp, info, pinned)
+                fields = (info.extract_version, info.flag_bits, info.compress_type, *stamp,
+                          info.CRC, info.compress_size, info.file_size, info.extra)
+                copied += 1
+            out.write(record)
+            central.append(_central(info, fields, offset))
+            offset += len(record)
+    directory = b"".join(central)
+    out.write(directory)
+    out.write(_END.pack(b"PK\x05\x06", 0, 0, len(central), len(central),
+                        len(directory), offset, 0))
+    return copied
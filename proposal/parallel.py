@@ -0,0 +1,82 @@
+"""
+Render proposal sections in worker processes and merge the bodies.
+
+Each section is built and rendered into its own scratch document in a worker,
+which sends back the serialised ``w:body`` children. The parent splices the
+fragments into the real document in section order as they arrive, so wall time
+for a large proposal approaches the slowest section rather than the sum.
+
+Fragments need little reconciliation: every worker starts from the same cached
+template, so paragraph, table and numbered (``List Bullet``) styles already
+match; ad-hoc character styles are re-created from ``Section.styles`` in the
+parent. Sections with images (whose media parts and ``r:embed`` ids belong to
+the parent package) are rendered in the parent, as is any section whose
+fragment turns out to reference a relationship.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from docx.oxml import parse_xml
+from lxml import etree
+
+from .images import image_nodes
+from .render_docx import render_section
+from .styles import ensure_character_style
+from .template import new_document, warm_worker
+
+_RELATIONSHIP_REF = re.compile(rb'\br:(?:id|embed|link|pict)="')
+
+
+def render_fragment(section):
+    """Render one ``ir.Section`` into a scratch document; return its ``w:body`` XML."""
+    doc = new_document()
+    body = doc.element.body
+    render_section(doc, section)
+    wrapper = etree.Element(body.tag, nsmap=body.nsmap)
+    wrapper.extend(body[:-1])  # everything but the trailing w:sectPr
+    return etree.tostring(wrapper)
+
+
+class ParallelRenderer:
+    """Render ``sections`` ahead in a process pool; ``render`` splices each result in.
+
+    Use as the ``render`` callable of ``build_proposal`` (same signature as
+    ``render_section``). Sections not submitted up front are rendered in-process.
+    """
+
+    def __init__(self, sections, jobs=None, executor=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self._own = executor is None
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(sections)) or 1, initializer=warm_worker)
+        # Largest sections first, so the slowest one starts straight away
+        order = sorted((s for s in sections if not image_nodes([s])), key=lambda s: -len(s.children))
+        self.futures = {id(s): self.executor.submit(render_fragment, s) for s in order}
+        self.local = 0
+
+    def render(self, doc, section, profiler=None):
+        future = self.futures.pop(id(section), None)
+        fragment = future.result() if future is not None else None
+        if fragment is None or _RELATIONSHIP_REF.search(fragment):
+            self.local += 1
+            render_section(doc, section, profiler)
+            return
+        for style_id, (size, color, bold) in section.styles.items():
+            ensure_character_style(doc, style_id, size, color, bold)
+        sect_pr = doc.element.body[-1]
+        for child in list(parse_xml(fragment)):
+            sect_pr.addprevious(child)
+
+    def close(self):
+        for future in self.futures.values():
+            future.cancel()
+        if self._own:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
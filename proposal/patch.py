@@ -0,0 +1,137 @@
+"""
+Patch sections of an existing proposal .docx in place.
+
+``build_proposal`` wraps every section in a pair of hidden bookmarks
+(``_Proposal_Section_E`` ...). A price revision only needs Section E, so
+``patch_docx`` renders just the requested sections into a scratch document,
+splices their XML between the bookmarks in ``word/document.xml`` as bytes (no
+parse of the full part), and rewrites the package: unchanged zip members are
+copied byte for byte, compressed data included, and only the edited parts are
+deflated again. Patched tables get the same fixed column widths as a full
+build, and the spliced document is paginated again so the TOC page numbers
+follow a section that grew or shrank; that needs one parse of the document
+part (``layout=False`` skips it and leaves the TOC as it was).
+"""
+
+import copy
+import re
+import zipfile
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from .build import SECTIONS, layout_document, resolve_content, section_bookmark
+from .images import image_nodes
+from .layout import fix_table_widths
+from .package import atomic_write, rewrite_zip
+from .render_docx import render_section
+from .template import new_document
+
+# Sections that depend on the fee tables
+PATCH_SECTIONS = ("Section E",)
+
+DOCUMENT = "word/document.xml"
+STYLES = "word/styles.xml"
+
+
+# ── Fragments ──
+
+def _fragments(data, names):
+    """Render ``names`` into a scratch document; return ``(fragments, styles)``.
+
+    ``fragments`` maps section name to the serialised body children;
+    ``styles`` maps each ad-hoc style id to its ``w:style`` element.
+    """
+    builders = dict(SECTIONS)
+    unknown = [name for name in names if name not in builders]
+    if unknown:
+        raise ValueError(f"unknown section(s): {', '.join(unknown)} "
+                         f"(expected one of {', '.join(builders)})")
+    doc = new_document()
+    body = doc.element.body
+    fragments, style_ids = {}, set()
+    for name in names:
+        section = builders[name](data)
+        if image_nodes([section]):
+            raise ValueError(f"{name}: sections with images cannot be patched; rebuild the document")
+        style_ids.update(section.styles)
+        before = len(body)
+        render_section(doc, section)
+        fix_table_widths(doc, body[before - 1:len(body) - 1])
+        # Serialise under a bare w:body so the children carry no namespace declarations
+        wrapper = etree.Element(body.tag, nsmap=body.nsmap)
+        wrapper.extend(body[before - 1:len(body) - 1])
+        xml = etree.tostring(wrapper, encoding="UTF-8", xml_declaration=False)
+        fragments[name] = xml[xml.index(b">") + 1:xml.rindex(b"</")]
+    styles = {style.get(qn("w:styleId")): style
+              for style in doc.styles.element.iterchildren(qn("w:style"))
+              if style.get(qn("w:styleId")) in style_ids}
+    return fragments, styles
+
+def _splice(xml, name, fragment):
+    """Replace the content between the bookmarks of section ``name`` in ``xml``."""
+    bookmark = section_bookmark(name)
+    start = re.search(rb'<w:bookmarkStart\b[^>]*\bw:name="' + re.escape(bookmark.encode()) + rb'"[^>]*/>', xml)
+    if start is None:
+        raise ValueError(f"{name}: bookmark {bookmark!r} not found; rebuild the document once "
+                         "with this version before patching it")
+    mark_id = re.search(rb'\bw:id="([^"]*)"', start.group()).group(1)
+    end = re.compile(rb'<w:bookmarkEnd\b[^>]*\bw:id="' + re.escape(mark_id) + rb'"[^>]*/>').search(xml, start.end())
+    if end is None:
+        raise ValueError(f"{name}: bookmark {bookmark!r} is not closed")
+    return xml[:start.end()] + fragment + xml[end.start():]
+
+def _add_styles(xml, styles):
+    """Append any ``styles`` whose id is missing from the styles part; ``None`` if none are."""
+    missing = [s for style_id, s in styles.items() if f'w:styleId="{style_id}"'.encode() not in xml]
+    if not missing:
+        return None
+    root = etree.fromstring(xml)
+    root.extend(missing)
+    return etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+
+def _relayout(path, xml, styles, data):
+    """Paginate the spliced document ``xml`` and return it with the TOC page numbers updated.
+
+    Styles and numbering come from the package at ``path``, plus any of the
+    patched ``styles`` it lacks.
+    """
+    doc = Document(path)
+    root = doc.styles.element
+    present = {style.get(qn("w:styleId")) for style in root.iterchildren(qn("w:style"))}
+    root.extend(copy.deepcopy(style) for style_id, style in styles.items() if style_id not in present)
+    doc.element.replace(doc.element.body, parse_xml(xml).find(qn("w:body")))
+    layout_document(doc, data)
+    return doc.part.blob
+
+
+# ── Entry point ──
+
+def patch_docx(path, data=None, out=None, sections=PATCH_SECTIONS, layout=True):
+    """Re-render ``sections`` of the proposal at ``path`` from ``data``.
+
+    ``data`` overrides the default content as for ``build_proposal``. The
+    result is written to ``out`` (a path) or, by default, atomically back to
+    ``path``. Unless ``layout`` is false the TOC page numbers are estimated
+    again. Returns a summary mapping.
+    """
+    data = resolve_content(data)
+    fragments, styles = _fragments(data, list(sections))
+    with zipfile.ZipFile(path) as zin:
+        xml = zin.read(DOCUMENT)
+        styles_xml = zin.read(STYLES) if styles else None
+    for name, fragment in fragments.items():
+        xml = _splice(xml, name, fragment)
+    if layout:
+        xml = _relayout(path, xml, styles, data)
+    replace = {DOCUMENT: xml}
+    if styles:
+        patched = _add_styles(styles_xml, styles)
+        if patched is not None:
+            replace[STYLES] = patched
+
+    with atomic_write(out or path) as fh:
+        copied = rewrite_zip(path, fh, replace)
+    return {"sections": list(fragments), "rewritten": sorted(replace), "copied": copied}
@@ -0,0 +1,123 @@
+"""
+DOCX renderer for the ``proposal.ir`` document model.
+
+Each node type maps onto one helper from ``proposal.helpers`` (or
+``build_table`` / ``add_gantt_chart``); ``RENDERERS`` is the dispatch table.
+Images are embedded from ``proposal.images``, already downscaled.
+"""
+
+import io
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches
+
+from . import ir
+from .gantt import add_gantt_chart
+from .images import prepared_image
+from .helpers import (
+    set_cell_shading, set_cell_border, add_info_box, add_section_heading,
+    add_body, add_bullet, add_bar_chart, add_icon_card_row, add_phase_block,
+    add_run, add_paragraph_border,
+)
+from .styles import ensure_character_style
+from .tables import build_table
+
+ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+}
+
+
+def _fill_paragraph(p, node):
+    if node.style:
+        p._p.style = node.style
+    if node.align:
+        p.alignment = ALIGNMENTS[node.align]
+    if node.border:
+        add_paragraph_border(p, *node.border)
+    for text, style in node.runs:
+        add_run(p, text, style)
+
+def _render_grid(doc, cells, cols):
+    table = doc.add_table(rows=(len(cells) + cols - 1) // cols, cols=cols)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    for idx, box in enumerate(cells):
+        cell = table.rows[idx // cols].cells[idx % cols]
+        if box.fill:
+            set_cell_shading(cell, box.fill)
+        if box.borders:
+            set_cell_border(cell, **box.borders)
+        cell.text = ""
+        for i, para in enumerate(box.paragraphs):
+            _fill_paragraph(cell.paragraphs[0] if i == 0 else cell.add_paragraph(), para)
+    return table
+
+def _render_table(doc, node):
+    row_styles = node.row_styles
+    if isinstance(row_styles, list):
+        row_format = lambda i, row: row_styles[i]
+    else:
+        row_format = lambda i, row: row_styles
+    return build_table(
+        doc, node.rows, node.header,
+        style=node.style,
+        banded=node.banded,
+        total_row=node.total_row,
+        row_format=row_format,
+        col_align=node.col_align,
+        header_align=node.header_align,
+        col_widths=node.col_widths,
+        header_style=node.header_style,
+        autofit=node.autofit,
+    )
+
+def _render_spacer(doc, node):
+    for _ in range(node.count):
+        doc.add_paragraph("")
+
+def _render_image(doc, node):
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p.add_run().add_picture(io.BytesIO(prepared_image(node)), width=Inches(node.width))
+    if node.caption:
+        _fill_paragraph(doc.add_paragraph(), ir.Para([(node.caption, "NoteText")], align="center"))
+
+RENDERERS = {
+    ir.Heading: lambda doc, n: add_section_heading(doc, n.text, n.level),
+    ir.Body: lambda doc, n: add_body(doc, n.text),
+    ir.Para: lambda doc, n: _fill_paragraph(doc.add_paragraph(), n),
+    ir.Spacer: _render_spacer,
+    ir.PageBreak: lambda doc, n: doc.add_page_break(),
+    ir.Bullet: lambda doc, n: add_bullet(doc, n.text, n.prefix),
+    ir.InfoBox: lambda doc, n: add_info_box(doc, n.title, n.content, n.fill),
+    ir.Box: lambda doc, n: _render_grid(doc, [n], 1),
+    ir.Grid: lambda doc, n: _render_grid(doc, n.cells, n.cols),
+    ir.CardRow: lambda doc, n: add_icon_card_row(doc, n.cards),
+    ir.PhaseBlock: lambda doc, n: add_phase_block(
+        doc, n.number, n.title, n.duration, n.items, n.color),
+    ir.Table: _render_table,
+    ir.BarChart: lambda doc, n: add_bar_chart(doc, n.bars),
+    ir.Gantt: lambda doc, n: add_gantt_chart(doc, n.phases, n.granularity, n.start),
+    ir.Image: _render_image,
+}
+
+def render_section(doc, section, profiler=None):
+    """Append one ``ir.Section`` to ``doc``, timing each node under ``profiler``."""
+    for style_id, (size, color, bold) in section.styles.items():
+        ensure_character_style(doc, style_id, size, color, bold)
+    for node in section.children:
+        render = RENDERERS[type(node)]
+        if profiler is None:
+            render(doc, node)
+        else:
+            profiler.helper(type(node).__name__, render, doc, node)
+    if section.page_break:
+        doc.add_page_break()
+
+def render_docx(doc, sections):
+    """Append every section of the document model to ``doc``."""
+    for section in sections:
+        render_section(doc, section)
+    return doc
@@ -0,0 +1,137 @@
+"""
+Markdown renderer for the ``proposal.ir`` document model.
+
+Produces the ``.md`` twin of the proposal from the same sections the DOCX
+renderer draws. Layout-only nodes (spacers, shading, borders) are dropped and
+runs in a bold character style are emphasised. ``RENDERERS`` maps each node
+type to a function returning one Markdown block (or ``None``).
+"""
+
+from . import ir
+from .gantt import chart_spans
+from .styles import CHARACTER_STYLES
+
+BAR_CELLS = 20
+FULL, EMPTY = "\u2588", "\u2591"
+
+
+def _lines(text):
+    """Hard line breaks for multi-line paragraph text."""
+    return text.replace("\n", "  \n")
+
+def _strong(text):
+    """Wrap ``text`` in ``**``, keeping edge spaces outside the markers."""
+    stripped = text.strip()
+    if not stripped:
+        return text
+    lead = text[:len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()):]
+    return f"{lead}**{stripped}**{trail}"
+
+def _bar(filled, total):
+    return "`" + FULL * filled + EMPTY * (total - filled) + "`"
+
+def _cell(text):
+    return str(text).replace("|", "\\|").replace("\n", "<br>")
+
+def _table(header, rows):
+    if header is None:
+        # Markdown tables need a header row; promote the first data row
+        if not rows:
+            return None
+        header, rows = rows[0], rows[1:]
+    lines = ["| " + " | ".join(map(_cell, header)) + " |",
+             "|" + "|".join("---" for _ in header) + "|"]
+    lines += ["| " + " | ".join(map(_cell, row)) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+class _Context:
+    """Per-render state: the set of character styles rendered as bold."""
+
+    def __init__(self):
+        self.bold = {style_id for style_id, spec in CHARACTER_STYLES.items() if spec[3]}
+
+    def runs(self, runs):
+        return "".join(_strong(text) if style in self.bold else text for text, style in runs)
+
+    def box(self, box):
+        return "  \n".join(_lines(self.runs(p.runs)) for p in box.paragraphs)
+
+
+def _heading(ctx, n):
+    return "#" * (n.level + 1) + " " + (n.text.upper() if n.level == 1 else n.text)
+
+def _para(ctx, n):
+    text = ctx.runs(n.runs)
+    if text.strip():
+        return _lines(text)
+    # Empty paragraphs carrying a border are the cover's colour bars
+    return "---" if n.border else None
+
+def _info_box(ctx, n):
+    body = "\n".join("> " + line if line else ">" for line in n.content.split("\n"))
+    return f"> **{n.title}**\n>\n{body}"
+
+def _phase_block(ctx, n):
+    items = "\n".join(f"- {item}" for item in n.items)
+    return f"**Phase {n.number}: {n.title}** *({n.duration})*\n\n{items}"
+
+def _bar_chart(ctx, n):
+    lines = []
+    for label, pct, _ in n.bars:
+        filled = min(BAR_CELLS, max(0, round(float(pct) * BAR_CELLS / 100)))
+        lines.append(f"- {label}: {_bar(filled, BAR_CELLS)} {pct}%")
+    return "\n".join(lines)
+
+def _gantt(ctx, n):
+    spans, units = chart_spans(n.phases, n.granularity, n.start)
+    unit = "Weeks" if n.granularity == "week" else "Days"
+    rows = [(name, f"{first}\u2013{last}" if last >= first else "\u2013",
+             "`" + EMPTY * (first - 1) + FULL * (last - first + 1) + EMPTY * (units - last) + "`")
+            for name, first, last, _ in spans]
+    return _table(["Phase", unit, "Timeline"], rows)
+
+def _image(ctx, n):
+    image = f"![{n.caption or ''}](<{n.path}>)"
+    return f"{image}\n\n*{n.caption}*" if n.caption else image
+
+RENDERERS = {
+    ir.Heading: _heading,
+    ir.Body: lambda ctx, n: _lines(n.text),
+    ir.Para: _para,
+    ir.Spacer: lambda ctx, n: None,
+    ir.PageBreak: lambda ctx, n: "---",
+    ir.Bullet: lambda ctx, n: "- " + (_strong(n.prefix) if n.prefix else "") + n.text,
+    ir.InfoBox: _info_box,
+    ir.Box: lambda ctx, n: "> " + ctx.box(n).replace("\n", "\n> "),
+    ir.Grid: lambda ctx, n: "\n".join("- " + ctx.box(cell).replace("\n", "\n  ") for cell in n.cells),
+    ir.CardRow: lambda ctx, n: "\n".join(f"- {icon} **{title}** \u2013 {desc}" for icon, title, desc in n.cards),
+    ir.PhaseBlock: _phase_block,
+    ir.Table: lambda ctx, n: _table(n.header, n.rows),
+    ir.BarChart: _bar_chart,
+    ir.Gantt: _gantt,
+    ir.Image: _image,
+}
+
+def render_markdown(sections):
+    """Return the Markdown text for a list of ``ir.Section``."""
+    ctx = _Context()
+    blocks = []
+    previous = None
+    for section in sections:
+        ctx.bold.update(style_id for style_id, (_, _, bold) in section.styles.items() if bold)
+        for node in section.children:
+            block = RENDERERS[type(node)](ctx, node)
+            if block is None:
+                continue
+            # Consecutive bullets form one list
+            if type(node) is ir.Bullet and previous is ir.Bullet:
+                blocks[-1] += "\n" + block
+            else:
+                blocks.append(block)
+            previous = type(node)
+        if section.page_break:
+            blocks.append("---")
+            previous = None
+    return "\n\n".join(blocks) + "\n"
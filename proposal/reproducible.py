@@ -0,0 +1,128 @@
+"""
+Deterministic output and a content-addressed cache of built documents.
+
+python-docx already writes parts in a stable order with stable relationship
+ids (every document starts from the same cached template); what varies
+between two builds is the zip timestamp of each member. ``save_deterministic``
+pins those and the ``docProps/core.xml`` dates to ``source_date()``, so
+identical content always gives identical bytes.
+
+``OutputCache`` keys each build by the SHA-256 of the resolved content, the
+images it embeds, the ``build_proposal`` options, the package source and the
+pinned date, and hands back the stored .docx on a hit without building
+anything.
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+from .build import build_proposal, resolve_content
+from .content_file import json_default
+from .images import content_images, source_hash
+from .incremental import code_version
+from .package import atomic_write, rewrite_zip
+
+# Earliest timestamp a zip member can carry
+ZIP_EPOCH = datetime(1980, 1, 1)
+
+# build_proposal options that do not change the saved document
+NEUTRAL_OPTIONS = ("cache", "jobs", "profiler")
+# ... and those that do, with their defaults (part of every key)
+KEYED_OPTIONS = {name: param.default for name, param in inspect.signature(build_proposal).parameters.items()
+                 if name not in ("data", "out", "markdown", "deterministic", *NEUTRAL_OPTIONS)}
+
+
+def source_date():
+    """The pinned build date: ``SOURCE_DATE_EPOCH`` (UTC) if set, else 1980-01-01."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return ZIP_EPOCH
+    when = datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None)
+    return max(when, ZIP_EPOCH)
+
+def save_deterministic(doc, out):
+    """Save ``doc`` to a path or binary stream with pinned dates and timestamps."""
+    when = source_date()
+    props = doc.core_properties
+    props.created = props.modified = when
+    props.revision = 1
+    buf = io.BytesIO()
+    doc.save(buf)
+    stamp = when.timetuple()[:6]
+    if hasattr(out, "write"):
+        rewrite_zip(buf, out, date_time=stamp)
+    else:
+        with open(out, "wb") as fh:
+            rewrite_zip(buf, fh, date_time=stamp)
+
+
+class OutputCache:
+    """Built documents stored as ``output-<key>.docx`` files in ``directory``."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, data=None, **options):
+        """Cache key of ``data`` built with the ``build_proposal`` ``options``."""
+        unknown = sorted(set(options) - set(KEYED_OPTIONS) - set(NEUTRAL_OPTIONS))
+        if unknown:
+            raise TypeError(f"OutputCache cannot build with option(s): {', '.join(unknown)}")
+        keyed = {name: options.get(name, default) for name, default in KEYED_OPTIONS.items()}
+        data = resolve_content(data)
+        content = json.dumps([data, keyed], sort_keys=True, ensure_ascii=False, default=json_default)
+        digest = hashlib.sha256(f"{code_version()}\0{source_date().isoformat()}\0".encode())
+        digest.update(content.encode("utf-8"))
+        for path in content_images(data):
+            digest.update(source_hash(path).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"output-{key}.docx")
+
+    def build(self, data=None, out=None, **options):
+        """Write the document for ``data`` to ``out`` (path or binary stream).
+
+        Returns ``True`` when it came from the cache. On a miss the document
+        is built deterministically (``options`` go to ``build_proposal``) and
+        stored before being written out.
+        """
+        path = self._path(self.key(data, **options))
+        if os.path.exists(path):
+            self.hits += 1
+            if out is not None:
+                if hasattr(out, "write"):
+                    with open(path, "rb") as fh:
+                        shutil.copyfileobj(fh, out)
+                else:
+                    shutil.copyfile(path, out)
+            return True
+
+        self.misses += 1
+        buf = io.BytesIO()
+        build_proposal(data, out=buf, deterministic=True, **options)
+        payload = buf.getvalue()
+        with atomic_write(path) as fh:
+            fh.write(payload)
+        if out is not None:
+            if hasattr(out, "write"):
+                out.write(payload)
+            else:
+                with open(out, "wb") as fh:
+                    fh.write(payload)
+        return False
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.startswith("output-") and name.endswith(".docx"):
+                os.unlink(os.path.join(self.directory, name))
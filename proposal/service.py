@@ -0,0 +1,265 @@
+"""
+Local HTTP service that turns a JSON content payload into a proposal .docx.
+
+    python -m proposal.service --port 8080 -j 4
+    curl -X POST --data @content.json localhost:8080/proposal -o eoi.docx
+    curl localhost:8080/metrics
+
+``POST /proposal`` takes any subset of the content keys (validated like a
+content file, Gantt timelines limited to ``gantt.MAX_UNITS`` units) and
+returns the document; invalid payloads get ``400``. Keys that name files on
+the server (``screenshots``, ``references[].screenshots``, ``image_dpi``) are
+refused. ``GET /metrics`` reports counters and
+p50/p99 latency over the most recent requests; ``GET /health`` answers ``ok``.
+
+Jobs go through a bounded queue into a pool of worker processes that import
+python-docx and load the template before the first request. When the queue is
+full new jobs are refused straight away with ``503`` and ``Retry-After``, so a
+burst degrades into fast rejections rather than unbounded memory. A job that
+is not finished within ``--timeout`` seconds of arriving gets ``504``; a job
+already running in a worker cannot be interrupted, so it completes there and
+its result is dropped. Only the standard library is used (asyncio streams).
+"""
+
+import argparse
+import asyncio
+import collections
+import io
+import json
+import math
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from .build import build_bytes
+from .content_file import validate
+from .reproducible import OutputCache
+from .template import warm_worker
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+MAX_BODY = 1 << 20
+LATENCY_WINDOW = 10000
+
+# Content keys that reference server-side files, never accepted over HTTP
+PATH_KEYS = ("screenshots", "image_dpi")
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error",
+           503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+def _generate(data, cache_dir=None):
+    """Worker: build one proposal and return its bytes."""
+    if cache_dir:
+        buf = io.BytesIO()
+        OutputCache(cache_dir).build(data, buf)
+        return buf.getvalue()
+    return build_bytes(data)
+
+def check_payload(data):
+    """Raise ``ValueError`` if the validated payload ``data`` refers to server-side files."""
+    refused = [key for key in PATH_KEYS if key in data]
+    for i, ref in enumerate(data.get("references") or ()):
+        if isinstance(ref, dict) and "screenshots" in ref:
+            refused.append(f"references[{i}].screenshots")
+    if refused:
+        raise ValueError(f"payload: {', '.join(refused)} cannot be set over HTTP")
+    return data
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (``None`` when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class ProposalService:
+    """Bounded job queue in front of a warm process pool."""
+
+    def __init__(self, jobs=None, queue_size=64, timeout=30.0, cache_dir=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.queue = asyncio.Queue(queue_size)
+        self.pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=warm_worker)
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.counts = collections.Counter()
+        self.running = 0
+        self._dispatchers = []
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        # Start every worker now so the first requests do not pay for the imports
+        await asyncio.gather(*(loop.run_in_executor(self.pool, warm_worker) for _ in range(self.jobs)))
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.jobs)]
+
+    async def close(self):
+        for task in self._dispatchers:
+            task.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            data, result = await self.queue.get()
+            try:
+                if result.done():  # timed out while queued
+                    continue
+                self.running += 1
+                try:
+                    payload = await loop.run_in_executor(self.pool, _generate, data, self.cache_dir)
+                except Exception as exc:
+                    if not result.done():
+                        result.set_exception(exc)
+                else:
+                    if not result.done():
+                        result.set_result(payload)
+                finally:
+                    self.running -= 1
+            finally:
+                self.queue.task_done()
+
+    async def submit(self, data):
+        """Queue one job and wait for its bytes; raises ``asyncio.QueueFull`` or ``TimeoutError``."""
+        result = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((data, result))
+        try:
+            return await asyncio.wait_for(result, self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"job not finished within {self.timeout:g}s") from None
+
+    def metrics(self):
+        latencies = list(self.latencies)
+        p50, p99 = percentile(latencies, 50), percentile(latencies, 99)
+        return {
+            **{key: self.counts[key] for key in ("requests", "completed", "failed", "rejected", "timeouts")},
+            "queued": self.queue.qsize(),
+            "running": self.running,
+            "workers": self.jobs,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+        }
+
+    # ── HTTP ──
+
+    async def _proposal(self, body):
+        self.counts["requests"] += 1
+        t0 = time.perf_counter()
+        try:
+            data = check_payload(validate(json.loads(body or b"{}"), "payload"))
+        except (ValueError, UnicodeDecodeError) as exc:
+            self.counts["failed"] += 1
+            return 400, {}, f"{exc}\n".encode()
+        try:
+            payload = await self.submit(data)
+        except asyncio.QueueFull:
+            self.counts["rejected"] += 1
+            return 503, {"Retry-After": "1"}, b"queue full\n"
+        except TimeoutError as exc:
+            self.counts["timeouts"] += 1
+            return 504, {}, f"{exc}\n".encode()
+        except Exception:
+            # Payloads are validated up front, so this is a bug: log it, do not echo it
+            self.counts["failed"] += 1
+            traceback.print_exc()
+            return 500, {}, b"internal error\n"
+        self.counts["completed"] += 1
+        self.latencies.append(time.perf_counter() - t0)
+        return 200, {"Content-Type": DOCX_TYPE,
+                     "Content-Disposition": 'attachment; filename="proposal.docx"'}, payload
+
+    async def route(self, method, path, body):
+        path = path.split("?", 1)[0]
+        if path == "/proposal":
+            if method != "POST":
+                return 405, {"Allow": "POST"}, b""
+            return await self._proposal(body)
+        if path == "/metrics" and method == "GET":
+            return 200, {"Content-Type": "application/json"}, json.dumps(self.metrics()).encode()
+        if path == "/health" and method == "GET":
+            return 200, {"Content-Type": "text/plain"}, b"ok\n"
+        return 404, {}, b"not found\n"
+
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection (keep-alive unless the client closes)."""
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                try:
+                    method, path, version = request.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {}, b"", close=True)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get("content-length") or "0"
+                if not (length.isascii() and length.isdigit()):
+                    await self._respond(writer, 400, {}, b"bad content-length\n", close=True)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {}, b"payload too large\n", close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                close = (headers.get("connection", "").lower() == "close"
+                         or version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive")
+                status, extra, payload = await self.route(method, path, body)
+                await self._respond(writer, status, extra, payload, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, headers, body, close=False):
+        head = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Length: {len(body)}"]
+        head += [f"{name}: {value}" for name, value in headers.items()]
+        if close:
+            head.append("Connection: close")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        writer.write(body)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8080, jobs=None, queue_size=64, timeout=30.0, cache_dir=None):
+    service = ProposalService(jobs, queue_size, timeout, cache_dir)
+    await service.start()
+    server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+    print(f"Serving proposals on http://{host}:{port}/proposal "
+          f"({service.jobs} worker(s), queue {queue_size}, timeout {timeout:g}s)")
+    sys.stdout.flush()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve proposal generation over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--queue", type=int, default=64, help="jobs allowed to wait before 503 (default 64)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds per job, queueing included")
+    parser.add_argument("--cache-dir", metavar="DIR", help="serve unchanged proposals from an output cache")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.jobs, args.queue, args.timeout, args.cache_dir))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
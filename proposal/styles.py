@@ -0,0 +1,143 @@
+"""
+Named style registry.
+
+The palette is turned into real paragraph and character styles in
+``styles.xml`` once, when the page-setup template is cached. Helpers then tag
+paragraphs and runs with a style id instead of writing size, colour, font and
+weight onto every run.
+"""
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.shared import Pt
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
+
+from .fragments import FRAGMENTS
+from .helpers import (
+    DEEP_BLUE, OCEAN_BLUE, ACCENT_GREEN, DARK_GRAY, MEDIUM_GRAY, WHITE,
+    ACCENT_BAR, TABLE_HEADER_BG, TABLE_ALT_ROW, hex_to_rgb,
+)
+
+# ── Character Styles ──
+# style_id: (display name, size pt, colour, bold, italic)
+CHARACTER_STYLES = {
+    "CoverTitle":     ("Cover Title", 28, DEEP_BLUE, True, False),
+    "CoverSubtitle":  ("Cover Subtitle", 16, OCEAN_BLUE, False, False),
+    "CoverDate":      ("Cover Date", 14, OCEAN_BLUE, True, False),
+    "PartyName":      ("Party Name", 14, DEEP_BLUE, True, False),
+    "LabelText":      ("Label Text", 10, MEDIUM_GRAY, False, False),
+    "SmallText":      ("Small Text", 10, DARK_GRAY, False, False),
+    "BoldText":       ("Bold Text", 11, DARK_GRAY, True, False),
+    "StrongText":     ("Strong Text", 11, DEEP_BLUE, True, False),
+    "TitleText":      ("Title Text", 12, DEEP_BLUE, True, False),
+    "TableHeader":    ("Table Header", 10, WHITE, True, False),
+    "TableStrong":    ("Table Strong", 10, DEEP_BLUE, True, False),
+    "AccentLabel":    ("Accent Label", 10, OCEAN_BLUE, True, False),
+    "TocSection":     ("TOC Section", 11, OCEAN_BLUE, True, False),
+    "TocPage":        ("TOC Page", 11, MEDIUM_GRAY, False, False),
+    "NoteText":       ("Note Text", 9, MEDIUM_GRAY, False, False),
+    "BadgeText":      ("Badge Text", 9, OCEAN_BLUE, False, False),
+    "PhaseDuration":  ("Phase Duration", 9, OCEAN_BLUE, False, True),
+    "PhaseNumber":    ("Phase Number", 20, WHITE, True, False),
+    "StepNumber":     ("Step Number", 16, WHITE, True, False),
+    "StepLabel":      ("Step Label", 8, WHITE, True, False),
+    "BarLabel":       ("Bar Label", 9, DARK_GRAY, True, False),
+    "BarValue":       ("Bar Value", 8, WHITE, True, False),
+    "TotalText":      ("Total Text", 11, WHITE, True, False),
+    "GrandTotalText": ("Grand Total Text", 12, WHITE, True, False),
+    "GanttHeader":    ("Gantt Header", 7, WHITE, True, False),
+    "GanttLabel":     ("Gantt Label", 7, DARK_GRAY, True, False),
+    "CardIcon":       ("Card Icon", 18, None, False, False),
+    "FeatureIcon":    ("Feature Icon", 12, None, False, False),
+    "CheckBox":       ("Check Box", 14, MEDIUM_GRAY, False, False),
+    "FooterNote":     ("Footer Note", 9, MEDIUM_GRAY, False, True),
+    "SignatureLine":  ("Signature Line", None, MEDIUM_GRAY, False, False),
+}
+
+# ── Paragraph Styles ──
+# style_id: (display name, size pt, colour, bold, space after pt, bottom border sz)
+PARAGRAPH_STYLES = {
+    "ProposalHeading1": ("Proposal Heading 1", 16, DEEP_BLUE, True, None, 12),
+    "ProposalHeading2": ("Proposal Heading 2", 13, OCEAN_BLUE, True, None, None),
+    "ProposalHeading3": ("Proposal Heading 3", 11, ACCENT_GREEN, True, None, None),
+    "ProposalBody":     ("Proposal Body", None, None, False, 6, None),
+}
+
+# ── Table Styles ──
+# Conditional cell shading for the header row, banded rows and total row, so
+# data tables need no per-cell w:shd for them. Text formatting stays on the
+# run styles above: Word lets the Normal paragraph style override a table
+# style's font size, so it is not safe to move it here.
+# style_id: (display name, {conditional type: fill})
+TABLE_STYLES = {
+    "ProposalTable": ("Proposal Table", {
+        "firstRow": TABLE_HEADER_BG,
+        "lastRow": "003D6B",
+        "band1Horz": TABLE_ALT_ROW,
+    }),
+    "ProposalTableEven": ("Proposal Table Even Bands", {
+        "firstRow": TABLE_HEADER_BG,
+        "lastRow": "003D6B",
+        "band2Horz": TABLE_ALT_ROW,
+    }),
+}
+
+
+def _apply_font(style, size, color, bold, italic=False):
+    font = style.font
+    if size is not None:
+        font.size = Pt(size)
+    if color is not None:
+        font.color.rgb = color
+    if bold:
+        font.bold = True
+    if italic:
+        font.italic = True
+
+def _add_style(styles, style_id, name, style_type):
+    style = styles.add_style(name, style_type)
+    style.style_id = style_id
+    return style
+
+def install_styles(doc):
+    """Add every registry style to ``doc`` (done once, on the cached template)."""
+    styles = doc.styles
+    for style_id, (name, size, color, bold, italic) in CHARACTER_STYLES.items():
+        style = _add_style(styles, style_id, name, WD_STYLE_TYPE.CHARACTER)
+        _apply_font(style, size, color, bold, italic)
+
+    for style_id, (name, size, color, bold, space_after, border) in PARAGRAPH_STYLES.items():
+        style = _add_style(styles, style_id, name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles['Normal']
+        style.quick_style = True
+        _apply_font(style, size, color, bold)
+        if space_after is not None:
+            style.paragraph_format.space_after = Pt(space_after)
+        if border is not None:
+            style.element.get_or_add_pPr().append(
+                FRAGMENTS.paragraph_border("bottom", border, "1", ACCENT_BAR))
+
+    for style_id, (name, conditions) in TABLE_STYLES.items():
+        style = _add_style(styles, style_id, name, WD_STYLE_TYPE.TABLE)
+        style.base_style = styles['Normal Table']
+        element = style.element
+        element.append(parse_xml(
+            f'<w:tblPr {nsdecls("w")}><w:tblStyleRowBandSize w:val="1"/></w:tblPr>'))
+        for kind, fill in conditions.items():
+            element.append(parse_xml(
+                f'<w:tblStylePr {nsdecls("w")} w:type="{kind}">'
+                f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{fill}"/></w:tcPr>'
+                f'</w:tblStylePr>'
+            ))
+
+def ensure_character_style(doc, style_id, size, color_hex, bold=False):
+    """Return ``style_id``, creating an ad-hoc character style on first use.
+
+    Used for colours that come from content (e.g. design concept accents)
+    rather than the palette.
+    """
+    styles = doc.styles
+    if styles.element.get_by_id(style_id) is None:
+        style = _add_style(styles, style_id, style_id, WD_STYLE_TYPE.CHARACTER)
+        _apply_font(style, size, hex_to_rgb(color_hex), bold)
+    return style_id
@@ -0,0 +1,129 @@
+"""
+Bulk table builder.
+
+Reaching cells through ``table.rows[r].cells[c]`` makes python-docx rebuild the
+row's cell grid on every access, so cell-by-cell filling grows much faster than
+the table. ``build_table`` instead writes every ``w:tr`` of a table as one XML
+string in a single pass over the data and parses it once. Cell markup matches
+what the cell-by-cell helpers produced (``cell.text = ""`` followed by a styled
+run); header, banding and total-row shading come from a table style.
+"""
+
+from xml.sax.saxutils import escape
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import parse_xml
+from docx.shared import Cm, Emu
+
+
+def _text_xml(text):
+    """Run content for ``text``, split on tabs and line breaks like ``run.text``."""
+    parts = []
+    buf = []
+
+    def flush():
+        chunk = "".join(buf)
+        if chunk:
+            space = ' xml:space="preserve"' if len(chunk.strip()) < len(chunk) else ""
+            parts.append(f"<w:t{space}>{escape(chunk)}</w:t>")
+        buf.clear()
+
+    for char in text:
+        if char == "\t":
+            flush()
+            parts.append("<w:tab/>")
+        elif char in "\r\n":
+            flush()
+            parts.append("<w:br/>")
+        else:
+            buf.append(char)
+    flush()
+    return "".join(parts)
+
+def cell_xml(text, style, fill, align, width, span=1):
+    """``w:tc`` markup for one cell of ``width`` twips, spanning ``span`` grid columns."""
+    tc_pr = f'<w:tcW w:type="dxa" w:w="{width}"/>'
+    if span > 1:
+        tc_pr += f'<w:gridSpan w:val="{span}"/>'
+    if fill:
+        tc_pr += f'<w:shd w:fill="{fill}"/>'
+    p_pr = f'<w:pPr><w:jc w:val="{align}"/></w:pPr>' if align else ""
+    # The leading empty run mirrors ``cell.text = ""`` in the cell-by-cell helpers
+    run = ""
+    if text or style:
+        r_pr = f'<w:rPr><w:rStyle w:val="{style}"/></w:rPr>' if style else ""
+        run = f"<w:r>{r_pr}{_text_xml(text)}</w:r>"
+    return f"<w:tc><w:tcPr>{tc_pr}</w:tcPr><w:p>{p_pr}<w:r/>{run}</w:p></w:tc>"
+
+def _per_column(value, ncols):
+    if isinstance(value, (list, tuple)):
+        return value
+    return (value,) * ncols
+
+def set_table_style(table, style, first_row, last_row, banded):
+    """Reference a table style and switch on the conditional formats in use."""
+    tbl_pr = table._tbl.tblPr
+    tbl_pr.style = style
+    look = tbl_pr.find(qn("w:tblLook"))
+    flags = {"firstRow": first_row, "lastRow": last_row, "noHBand": not banded}
+    for name, on in flags.items():
+        look.set(qn(f"w:{name}"), "1" if on else "0")
+    # Legacy bitmask for Word 2007: keep it consistent with the attributes
+    val = 0x0080 | 0x0400  # firstColumn, noVBand (python-docx defaults)
+    val |= 0x0020 if first_row else 0
+    val |= 0x0040 if last_row else 0
+    val |= 0x0200 if not banded else 0
+    look.set(qn("w:val"), f"{val:04X}")
+
+def build_table(doc, rows, header=None, *, style="ProposalTable", banded=False,
+                total_row=False, row_format=None, col_align=None, header_align=None,
+                col_widths=None, header_style="TableHeader", autofit=False):
+    """Append a table filled from a 2-D sequence in one linear pass.
+
+    Header, banded-row and total-row shading come from the ``style`` table
+    style (see ``proposal.styles.TABLE_STYLES``): the header row is styled when
+    ``header`` is given, ``banded`` turns on row banding and ``total_row``
+    styles the last row.
+
+    ``row_format(index, row)`` returns ``(style, fill)`` for a data row, where
+    each may be a single value or one value per column (``None`` = unstyled /
+    no direct shading). ``col_align`` gives a per-column paragraph alignment
+    (``"right"``, ``"center"`` or ``None``) applied to every row;
+    ``header_align`` overrides it for the header. ``col_widths`` are in cm.
+    """
+    ncols = len(header) if header is not None else max((len(r) for r in rows), default=0)
+    table = doc.add_table(rows=0, cols=ncols)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    if autofit:
+        table.autofit = True
+    set_table_style(table, style, header is not None, total_row, banded)
+
+    default_width = Emu(doc._block_width // ncols).twips if ncols else 0
+    widths = [default_width] * ncols
+    for i, width in enumerate((col_widths or [])[:ncols]):
+        widths[i] = Cm(width).twips
+    aligns = col_align or (None,) * ncols
+
+    xml = [f"<w:tbl {nsdecls('w')}>"]
+    if header is not None:
+        h_aligns = _per_column(header_align, ncols) if header_align else aligns
+        xml.append("<w:tr>")
+        for c, text in enumerate(header):
+            xml.append(cell_xml(text, header_style, None, h_aligns[c], widths[c]))
+        xml.append("</w:tr>")
+
+    for r, row in enumerate(rows):
+        run_style, fill = row_format(r, row) if row_format else (None, None)
+        styles = _per_column(run_style, ncols)
+        fills = _per_column(fill, ncols)
+        xml.append("<w:tr>")
+        for c, text in enumerate(row):
+            xml.append(cell_xml(str(text), styles[c], fills[c], aligns[c], widths[c]))
+        xml.append("</w:tr>")
+    xml.append("</w:tbl>")
+
+    tbl = table._tbl
+    for tr in parse_xml("".join(xml)).iterchildren():
+        tbl.append(tr)
+    return table
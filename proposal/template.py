@@ -0,0 +1,50 @@
+"""
+Page-setup template shared by every build.
+
+The template (margins, default font and the style registry) is built and
+serialised once per process; each build opens a fresh copy of the bytes. It
+lives apart from the section builders so that watch mode can reload those
+without discarding the cached template.
+"""
+
+import functools
+import io
+
+from docx import Document
+from docx.shared import Pt, Cm
+
+from .helpers import DARK_GRAY
+from .styles import install_styles
+
+
+@functools.lru_cache(maxsize=None)
+def _template_bytes():
+    """Serialise the page-setup template once per process."""
+    doc = Document()
+
+    # ── Page Margins ──
+    for section in doc.sections:
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        section.left_margin = Cm(2.5)
+        section.right_margin = Cm(2.5)
+
+    # ── Default Font ──
+    font = doc.styles['Normal'].font
+    font.name = 'Calibri'
+    font.size = Pt(11)
+    font.color.rgb = DARK_GRAY
+
+    install_styles(doc)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+def new_document():
+    """Return a fresh document opened from the cached template."""
+    return Document(io.BytesIO(_template_bytes()))
+
+def warm_worker():
+    """Pool initializer: import python-docx and cache the template up front."""
+    new_document()
@@ -0,0 +1,115 @@
+"""
+Watch mode: rebuild the proposal whenever its content source is saved.
+
+The process stays warm (interpreter, python-docx and the cached template), and
+rebuilds go through a ``SectionCache`` so only edited sections are rendered;
+fragments the latest build no longer uses are pruned after it.
+Sources are polled by mtime, which needs no extra dependency and is cheap for
+a handful of files; a burst of saves is debounced into one rebuild.
+"""
+
+import importlib
+import io
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+from . import build, content
+from .incremental import SectionCache
+from .package import atomic_write
+
+# Modules holding proposal wording, reloaded in this order when their file changes
+CONTENT_MODULES = (content, build)
+
+
+def _snapshot(paths):
+    stamps = {}
+    for path in paths:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            stamps[path] = None
+    return stamps
+
+def wait_for_change(paths, interval=0.01, debounce=0.03):
+    """Block until ``paths`` change and then stay quiet for ``debounce`` seconds.
+
+    Returns the set of changed paths.
+    """
+    seen = _snapshot(paths)
+    while True:
+        time.sleep(interval)
+        current = _snapshot(paths)
+        if current != seen:
+            break
+    changed = {p for p in paths if current[p] != seen[p]}
+    quiet_since = time.monotonic()
+    while time.monotonic() - quiet_since < debounce:
+        time.sleep(interval)
+        latest = _snapshot(paths)
+        if latest != current:
+            changed |= {p for p in paths if latest[p] != current[p]}
+            current = latest
+            quiet_since = time.monotonic()
+    return changed
+
+def _write_atomic(path, data):
+    with atomic_write(path) as fh:
+        fh.write(data)
+
+def _reload(changed):
+    """Re-import content modules whose source changed, and every module after them."""
+    files = [os.path.abspath(module.__file__) for module in CONTENT_MODULES]
+    first = min((files.index(p) for p in map(os.path.abspath, changed) if p in files), default=None)
+    if first is None:
+        return
+    for module in CONTENT_MODULES[first:]:
+        importlib.reload(module)
+
+def rebuild(output, markdown=None, cache=None, load_data=None):
+    """Build once and write ``output`` (and ``markdown``) atomically; return seconds taken."""
+    t0 = time.perf_counter()
+    buf = io.BytesIO()
+    text = io.StringIO() if markdown else None
+    data = load_data() if load_data else None
+    build.build_proposal(data, out=buf, markdown=text, cache=cache)
+    if cache is not None:
+        cache.prune()  # drop the fragments of sections edited away
+    _write_atomic(output, buf.getvalue())
+    if markdown:
+        _write_atomic(markdown, text.getvalue().encode("utf-8"))
+    return time.perf_counter() - t0
+
+def run_watch(output, markdown=None, cache_dir=None, paths=(), load_data=None):
+    """Rebuild on every change to the content modules or ``paths`` until interrupted.
+
+    ``load_data``, if given, is called before each build to produce the
+    content overrides (e.g. from an external content file listed in ``paths``).
+    Without ``cache_dir`` the sections are cached in a temporary directory
+    removed on exit.
+    """
+    if cache_dir is None:
+        with tempfile.TemporaryDirectory(prefix="proposal-cache-") as scratch:
+            return run_watch(output, markdown, scratch, paths, load_data)
+    cache = SectionCache(cache_dir)
+    watched = [os.path.abspath(m.__file__) for m in CONTENT_MODULES] + [os.path.abspath(p) for p in paths]
+
+    seconds = rebuild(output, markdown, cache, load_data)
+    print(f"Proposal saved to: {output} ({seconds * 1000:.0f} ms); watching for changes, Ctrl+C to stop")
+    try:
+        while True:
+            changed = wait_for_change(watched)
+            try:
+                _reload(changed)
+                seconds = rebuild(output, markdown, cache, load_data)
+            except Exception:
+                traceback.print_exc()
+                continue
+            names = ", ".join(sorted(os.path.basename(p) for p in changed))
+            print(f"{names} changed: rebuilt in {seconds * 1000:.0f} ms "
+                  f"({cache.hits} cached, {cache.misses} rendered sections so far)")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return 0
@@ -0,0 +1,101 @@
+"""Round trips through ``proposal.package``."""
+
+import io
+import os
+import stat
+import zipfile
+
+import pytest
+
+from proposal.package import atomic_write, rewrite_zip
+
+MEMBERS = {
+    "[Content_Types].xml": b"<Types/>",
+    "word/document.xml": b"<w:document>" + b"<w:p/>" * 500 + b"</w:document>",
+    "word/media/image1.png": bytes(range(256)) * 8,
+}
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream, so ``zipfile`` falls back to data descriptors."""
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buf.write(data)
+
+
+def _package(descriptors=False):
+    out = _Unseekable() if descriptors else io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in MEMBERS.items():
+            zf.writestr(zipfile.ZipInfo(name, (2024, 5, 17, 12, 30, 10)), data, zipfile.ZIP_DEFLATED)
+        zf.writestr("stored.txt", b"stored as is", zipfile.ZIP_STORED)
+    return io.BytesIO(out.buf.getvalue() if descriptors else out.getvalue())
+
+def _rewrite(source, **options):
+    out = io.BytesIO()
+    copied = rewrite_zip(source, out, **options)
+    out.seek(0)
+    return copied, zipfile.ZipFile(out)
+
+@pytest.mark.parametrize("descriptors", [False, True])
+def test_copied_members_are_unchanged(descriptors):
+    source = _package(descriptors)
+    if descriptors:
+        assert all(info.flag_bits & 0x08 for info in zipfile.ZipFile(source).infolist())
+    copied, zf = _rewrite(source)
+    assert copied == len(MEMBERS) + 1
+    assert zf.testzip() is None
+    for name, data in MEMBERS.items():
+        assert zf.read(name) == data
+        assert zf.getinfo(name).date_time == (2024, 5, 17, 12, 30, 10)
+    assert zf.read("stored.txt") == b"stored as is"
+    assert zf.getinfo("stored.txt").compress_type == zipfile.ZIP_STORED
+
+@pytest.mark.parametrize("descriptors", [False, True])
+def test_replaced_members(descriptors):
+    copied, zf = _rewrite(_package(descriptors), replace={"word/document.xml": b"<w:document/>"})
+    assert copied == len(MEMBERS)
+    assert zf.testzip() is None
+    assert zf.read("word/document.xml") == b"<w:document/>"
+    assert zf.read("word/media/image1.png") == MEMBERS["word/media/image1.png"]
+    assert [info.filename for info in zf.infolist()] == [*MEMBERS, "stored.txt"]
+
+def test_pinned_timestamps():
+    _, zf = _rewrite(_package(True), replace={"stored.txt": b"new"}, date_time=(1980, 1, 1, 0, 0, 0))
+    assert zf.testzip() is None
+    assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+    assert zf.read("stored.txt") == b"new"
+
+def test_atomic_write_keeps_mode(tmp_path):
+    path = tmp_path / "proposal.docx"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    with atomic_write(path) as fh:
+        fh.write(b"new")
+    assert path.read_bytes() == b"new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+def test_atomic_write_new_file_follows_umask(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        with atomic_write(tmp_path / "new.docx") as fh:
+            fh.write(b"data")
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(tmp_path / "new.docx").st_mode) == 0o644
+
+def test_atomic_write_error_leaves_target(tmp_path):
+    path = tmp_path / "proposal.docx"
+    path.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as fh:
+            fh.write(b"partial")
+            raise RuntimeError
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["proposal.docx"]